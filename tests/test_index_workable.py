@@ -3,7 +3,6 @@
 """
 
 import unittest
-import logging
 import sys
 import traceback
 
@@ -11,11 +10,10 @@ from workable.core.workable import Workable
 from workable.core.models import WorkableFrame
 from workable.core.content import Content
 from workable.core.exceptions import WorkableError, ConversionError
+from workable.tests import configure_test_logging
 
 
-# 配置日志
-logging.basicConfig(
-    level=logging.DEBUG,
+configure_test_logging(
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
     stream=sys.stdout
 )
@@ -109,11 +107,26 @@ class TestIndexedWorkable(unittest.TestCase):
             frame1 = content.get_frame(seq1)
             self.assertEqual(frame1.name, "更新的框架1")
             
+            # 测试移动框架 (顺序和类型索引同步更新)
+            content.move_frame(seq3, seq1)
+            self.assertEqual([f.name for f in content.frames], ["框架3", "更新的框架1", "框架2"])
+            self.assertEqual(content.get_main_frame().name, "框架3")
+            self.assertEqual(content.get_frames_by_type("local")[0].seq, seq1)
+            content.move_frame(seq1, seq3)
+            self.assertEqual([f.seq for f in content.frames], [seq1, seq2, seq3])
+
             # 测试删除框架
             self.assertTrue(content.remove_frame(seq3))
             self.assertEqual(content.frame_count, 2)
             self.assertEqual(len(content.get_frames_by_type("local")), 0)
             
+            # 测试通过UUID索引删除框架 (类型不匹配时不删除)
+            self.assertEqual(content.remove_frames_by_uuid("uuid2", frame_type="local"), [])
+            removed = content.remove_frames_by_uuid("uuid2", frame_type="child")
+            self.assertEqual([f.seq for f in removed], [seq2])
+            self.assertEqual(content.get_frame_by_uuid("uuid2"), [])
+            self.assertEqual(content.frame_count, 1)
+            
             # 测试验证
             self.assertTrue(content.validate())
             
@@ -4,6 +4,6 @@ Workable - 轻量级工作单元管理框架
 
 __version__ = "0.1.0"
 
-from workable.core.workable import Workable
+from workable.core.workable import Workable, SimpleWorkable, ComplexWorkable
 from workable.core.manager import WorkableManager
 from workable.visualizer import WorkableVisualizer 
\ No newline at end of file
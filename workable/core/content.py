@@ -4,15 +4,18 @@
 """
 
 import logging
-from typing import Dict, List, Optional, Tuple, TYPE_CHECKING, Any, Set
+import types
+from typing import Dict, Iterable, List, Mapping, Optional, Tuple, TYPE_CHECKING, Any, Set
 
-from workable.core.models import WorkableFrame
+from workable.core.models import WorkableFrame, _intern_str
 from workable.core.exceptions import ContentError
 
 # 避免循环导入
 if TYPE_CHECKING:
     from workable.core.workable import Workable
 
+logger = logging.getLogger('content')
+
 class Content:
     """
     内容管理类，实现索引式存储
@@ -20,10 +23,15 @@ class Content:
     采用封装与代理访问模式确保数据一致性
     """
     
+    __slots__ = (
+        'content_type', 'content', '_frames_by_seq', '_frames_by_uuid', '_frames_by_type',
+        '_next_seq', '_local_workables_cache',
+    )
+    
     def __init__(self, content_type: str = "text", content: str = ""):
         """初始化内容管理器"""
         # 基本内容属性
-        self.content_type = content_type
+        self.content_type = _intern_str(content_type)  # 内容类型取值有限，驻留后共享
         self.content = content
         
         # 序列化的框架索引存储
@@ -34,13 +42,12 @@ class Content:
         
         # 缓存本地工作单元引用 (仅缓存，不存储)
         self._local_workables_cache: Dict[str, 'Workable'] = {}
-        
-        self.logger = logging.getLogger('content')
     
     @property
-    def frames(self) -> List[WorkableFrame]:
-        """按序列号顺序获取所有frames"""
-        return [self._frames_by_seq[seq] for seq in sorted(self._frames_by_seq.keys())]
+    def frames(self) -> Tuple[WorkableFrame, ...]:
+        """按序列号顺序获取所有frames（只读元组）"""
+        # _frames_by_seq的插入顺序始终与序列号顺序一致，无需每次排序
+        return tuple(self._frames_by_seq.values())
     
     @property
     def frame_count(self) -> int:
@@ -48,9 +55,14 @@ class Content:
         return len(self._frames_by_seq)
     
     @property
-    def workables(self) -> Dict[str, 'Workable']:
-        """获取本地workables缓存（只读）"""
-        return self._local_workables_cache.copy()
+    def workables(self) -> Mapping[str, 'Workable']:
+        """获取本地workables缓存的只读映射，不复制字典"""
+        return types.MappingProxyType(self._local_workables_cache)
+    
+    @property
+    def workable_count(self) -> int:
+        """获取本地workables数量 (不复制缓存)"""
+        return len(self._local_workables_cache)
     
     def get_frame(self, seq: int) -> Optional[WorkableFrame]:
         """
@@ -94,8 +106,7 @@ class Content:
         """
         if not self._frames_by_seq:
             return None
-        min_seq = min(self._frames_by_seq.keys())
-        return self._frames_by_seq[min_seq]
+        return next(iter(self._frames_by_seq.values()))
     
     def get_workable(self, uuid: str) -> Optional['Workable']:
         """
@@ -161,9 +172,49 @@ class Content:
             self._frames_by_type[frame_type] = set()
         self._frames_by_type[frame_type].add(seq)
         
-        self.logger.debug(f"添加Frame: seq={seq}, type={frame_type}, uuid={uuid}")
+        logger.debug("添加Frame: seq=%s, type=%s, uuid=%s", seq, frame_type, uuid)
         return seq
     
+    def add_frames(self, specs: Iterable[Tuple[str, str, str, str]]) -> List[int]:
+        """
+        批量添加引用Frame，先整体校验再一次性写入索引
+        
+        Args:
+            specs: (名称, 逻辑描述, 帧类型, 引用UUID) 元组的集合
+            
+        Returns:
+            添加的Frame的序列号列表
+            
+        Raises:
+            ContentError: 如果存在名称或描述为空、或未指定UUID的Frame (此时不会添加任何Frame)
+        """
+        specs = list(specs)
+        for name, logic_description, frame_type, uuid in specs:
+            if not name or not logic_description:
+                raise ContentError("框架名称和逻辑描述不能为空")
+            if uuid is None:
+                raise ContentError("引用框架必须指定UUID")
+        
+        first_seq = self._next_seq
+        self._next_seq += len(specs)
+        
+        frames_by_seq = self._frames_by_seq
+        frames_by_uuid = self._frames_by_uuid
+        frames_by_type = self._frames_by_type
+        for seq, (name, logic_description, frame_type, uuid) in enumerate(specs, first_seq):
+            frames_by_seq[seq] = WorkableFrame(
+                name=name,
+                logic_description=logic_description,
+                seq=seq,
+                frame_type=frame_type,
+                exref=uuid
+            )
+            frames_by_uuid.setdefault(uuid, set()).add(seq)
+            frames_by_type.setdefault(frame_type, set()).add(seq)
+        
+        logger.debug("批量添加Frame: %s 个", len(specs))
+        return list(range(first_seq, self._next_seq))
+    
     def add_local_workable(self, workable: 'Workable') -> int:
         """
         添加本地Workable并创建对应的Frame
@@ -193,13 +244,11 @@ class Content:
                 is_local=True
             )
             
-            self.logger.debug(f"添加本地Workable: {workable.uuid}, seq={seq}")
+            logger.debug("添加本地Workable: %s, seq=%s", workable.uuid, seq)
             return seq
-        except Exception as e:
-            if not isinstance(e, ContentError):
-                e = ContentError(f"添加本地Workable失败: {str(e)}")
-            self.logger.error(str(e))
-            raise e
+        except ContentError as e:
+            logger.error(str(e))
+            raise
     
     def update_frame(self, seq: int, name: Optional[str] = None, 
                    logic_description: Optional[str] = None, 
@@ -217,7 +266,7 @@ class Content:
             是否成功更新
         """
         if seq not in self._frames_by_seq:
-            self.logger.warning(f"尝试更新不存在的Frame: seq={seq}")
+            logger.warning("尝试更新不存在的Frame: seq=%s", seq)
             return False
             
         frame = self._frames_by_seq[seq]
@@ -225,12 +274,12 @@ class Content:
         if name:
             frame.name = name
         if logic_description:
-            frame.logic_description = logic_description
+            frame.logic_description = _intern_str(logic_description)
         if metadata:
             for key, value in metadata.items():
                 frame.update_metadata(key, value)
                 
-        self.logger.debug(f"更新Frame: seq={seq}")
+        logger.debug("更新Frame: seq=%s", seq)
         return True
     
     def update_workable(self, uuid: str, name: Optional[str] = None, 
@@ -266,13 +315,11 @@ class Content:
                     if logic_description:
                         frame.logic_description = logic_description
             
-            self.logger.debug(f"更新Workable: {uuid}")
+            logger.debug("更新Workable: %s", uuid)
             return True
-        except Exception as e:
-            if not isinstance(e, ContentError):
-                e = ContentError(f"更新Workable失败: {str(e)}")
-            self.logger.error(str(e))
-            raise e
+        except ContentError as e:
+            logger.error(str(e))
+            raise
     
     def remove_frame(self, seq: int) -> Optional[WorkableFrame]:
         """
@@ -288,31 +335,67 @@ class Content:
             if seq not in self._frames_by_seq:
                 raise ContentError(f"序列号 {seq} 不存在")
             
-            frame = self._frames_by_seq[seq]
-            
-            # 从序列号索引中移除
-            del self._frames_by_seq[seq]
+            frame = self._remove_frame_fast(seq)
+            logger.debug("移除Frame: seq=%s", seq)
+            return frame
+        except ContentError as e:
+            logger.error(str(e))
+            raise
+    
+    def _remove_frame_fast(self, seq: int) -> WorkableFrame:
+        """
+        移除Frame并维护各索引，跳过存在性检查和日志 (供内部已验证的路径使用)
+        
+        Args:
+            seq: 已确认存在的Frame序列号
             
-            # 更新UUID索引
-            ref_uuid = frame.get_reference_uuid()
-            if ref_uuid and ref_uuid in self._frames_by_uuid:
-                self._frames_by_uuid[ref_uuid].discard(seq)
-                if not self._frames_by_uuid[ref_uuid]:
+        Returns:
+            被移除的Frame
+        """
+        frame = self._frames_by_seq.pop(seq)
+        
+        # 更新UUID索引
+        ref_uuid = frame.exref
+        if ref_uuid:
+            seqs = self._frames_by_uuid.get(ref_uuid)
+            if seqs is not None:
+                seqs.discard(seq)
+                if not seqs:
                     del self._frames_by_uuid[ref_uuid]
+        
+        # 更新类型索引
+        seqs = self._frames_by_type.get(frame.frame_type)
+        if seqs is not None:
+            seqs.discard(seq)
+            if not seqs:
+                del self._frames_by_type[frame.frame_type]
+        
+        return frame
+    
+    def remove_frames_by_uuid(self, uuid: str, frame_type: Optional[str] = None) -> List[WorkableFrame]:
+        """
+        通过UUID索引直接移除引用该UUID的所有Frame
+        
+        Args:
+            uuid: 工作单元UUID
+            frame_type: 可选的帧类型筛选
             
-            # 更新类型索引
-            if frame.frame_type in self._frames_by_type:
-                self._frames_by_type[frame.frame_type].discard(seq)
-                if not self._frames_by_type[frame.frame_type]:
-                    del self._frames_by_type[frame.frame_type]
-            
-            self.logger.debug(f"移除Frame: seq={seq}")
-            return frame
-        except Exception as e:
-            if not isinstance(e, ContentError):
-                e = ContentError(f"移除Frame失败: {str(e)}")
-            self.logger.error(str(e))
-            raise e
+        Returns:
+            被移除的Frame列表
+        """
+        seqs = self._frames_by_uuid.get(uuid)
+        if not seqs:
+            return []
+        
+        removed = []
+        for seq in list(seqs):
+            if frame_type and self._frames_by_seq[seq].frame_type != frame_type:
+                continue
+            removed.append(self._remove_frame_fast(seq))
+        
+        if removed:
+            logger.debug("通过UUID移除Frame: %s, 数量: %s", uuid, len(removed))
+        return removed
     
     def remove_local_workable(self, uuid: str) -> bool:
         """
@@ -340,13 +423,11 @@ class Content:
             for seq in sorted(seqs_to_remove, reverse=True):
                 self.remove_frame(seq)
             
-            self.logger.debug(f"删除本地Workable: {uuid}, 影响Frame数量: {len(seqs_to_remove)}")
+            logger.debug("删除本地Workable: %s, 影响Frame数量: %s", uuid, len(seqs_to_remove))
             return True
-        except Exception as e:
-            if not isinstance(e, ContentError):
-                e = ContentError(f"删除Workable失败: {str(e)}")
-            self.logger.error(str(e))
-            raise e
+        except ContentError as e:
+            logger.error(str(e))
+            raise
     
     def move_frame(self, from_seq: int, to_seq: int) -> bool:
         """
@@ -407,19 +488,22 @@ class Content:
                     self._frames_by_uuid[ref_uuid].discard(from_seq)
                     self._frames_by_uuid[ref_uuid].add(to_seq)
             
-            # 使用新索引替换旧索引
-            self._frames_by_seq = new_frames_by_seq
+            # 使用新索引替换旧索引 (按序列号重新排列，保持插入顺序与序列号顺序一致)
+            self._frames_by_seq = dict(sorted(new_frames_by_seq.items()))
+            
+            # 重建类型索引
+            self._frames_by_type = {}
+            for seq, f in self._frames_by_seq.items():
+                self._frames_by_type.setdefault(f.frame_type, set()).add(seq)
             
             # 更新下一个序列号
             self._next_seq = max(self._frames_by_seq.keys()) + 1 if self._frames_by_seq else 0
             
-            self.logger.debug(f"移动Frame: {from_seq} -> {to_seq}")
+            logger.debug("移动Frame: %s -> %s", from_seq, to_seq)
             return True
-        except Exception as e:
-            if not isinstance(e, ContentError):
-                e = ContentError(f"移动Frame失败: {str(e)}")
-            self.logger.error(str(e))
-            raise e
+        except ContentError as e:
+            logger.error(str(e))
+            raise
     
     def get_frames_by_type(self, frame_type: str) -> List[WorkableFrame]:
         """
@@ -447,7 +531,7 @@ class Content:
         注意：这只会清除缓存，不会删除实际的Frame
         """
         self._local_workables_cache = {}
-        self.logger.debug("清除本地Workable缓存")
+        logger.debug("清除本地Workable缓存")
     
     def validate(self) -> Tuple[bool, List[int], List[str]]:
         """
@@ -471,7 +555,7 @@ class Content:
         
         is_valid = not orphan_frames and not ghost_workables
         if not is_valid:
-            self.logger.warning(f"验证失败: 孤立Frames={orphan_frames}, 幽灵Workables={ghost_workables}")
+            logger.warning("验证失败: 孤立Frames=%s, 幽灵Workables=%s", orphan_frames, ghost_workables)
         
         return is_valid, orphan_frames, ghost_workables
     
@@ -502,11 +586,11 @@ class Content:
                     is_local=True
                 )
             
-            self.logger.info(f"修复了 {len(orphan_frames)} 个孤立Frames和 {len(ghost_workables)} 个幽灵Workables")
+            logger.info("修复了 %s 个孤立Frames和 %s 个幽灵Workables", len(orphan_frames), len(ghost_workables))
             return True
-        except Exception as e:
-            self.logger.error(f"修复失败: {str(e)}")
-            raise ContentError(f"修复一致性问题失败: {str(e)}")
+        except ContentError as e:
+            logger.error("修复失败: %s", e)
+            raise ContentError(f"修复一致性问题失败: {str(e)}") from e
     
     def clear_frames(self) -> None:
         """
@@ -517,4 +601,4 @@ class Content:
         self._frames_by_type.clear()
         self._next_seq = 1
         
-        self.logger.debug("清空所有框架") 
\ No newline at end of file
+        logger.debug("清空所有框架") 
\ No newline at end of file
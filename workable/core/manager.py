@@ -3,13 +3,23 @@ Workable管理模块 - 负责工作单元的创建、注册和查找
 支持索引式Workable管理，分离存储和引用
 """
 
-import uuid
+import sys
+import types
 import logging
-from typing import Dict, List, Optional, Set, Any
+from typing import Dict, Iterable, List, Mapping, Optional, Set, Any
 
-from workable.core.workable import Workable
+from workable.core.models import _new_uuid
+from workable.core.workable import Workable, SimpleWorkable, ComplexWorkable
 from workable.core.exceptions import WorkableError, ManagerError
 
+logger = logging.getLogger('workable_manager')
+
+# 空闲列表容量上限，避免删除大量工作单元后长期占用内存
+_FREELIST_MAX = 1024
+
+# 常见的具体工作单元类型，按类型身份判断可跳过isinstance的MRO查找
+_WORKABLE_TYPES = (SimpleWorkable, ComplexWorkable)
+
 
 class WorkableManager:
     """
@@ -17,12 +27,16 @@ class WorkableManager:
     支持基于索引的工作单元管理，实现解耦存储
     """
     
+    __slots__ = ('_workables', '_workable_by_name', '_atoms', '_composites',
+                 '_workable_freelist')
+    
     def __init__(self):
         """初始化WorkableManager"""
         self._workables: Dict[str, Workable] = {}  # UUID -> Workable
         self._workable_by_name: Dict[str, Set[str]] = {}  # name -> set(UUID)
-        
-        self.logger = logging.getLogger('workable_manager')
+        self._atoms: Dict[str, Workable] = {}  # 原子模式索引 UUID -> Workable
+        self._composites: Dict[str, Workable] = {}  # 复合模式索引 UUID -> Workable
+        self._workable_freelist: List[Workable] = []  # 已删除、可复用的实例
     
     def register(self, workable: Workable) -> None:
         """
@@ -34,24 +48,63 @@ class WorkableManager:
         Raises:
             ManagerError: 如果工作单元已经存在
         """
-        if not isinstance(workable, Workable):
+        if type(workable) not in _WORKABLE_TYPES and not isinstance(workable, Workable):
             raise ManagerError("只能注册Workable对象")
             
         if workable.uuid in self._workables:
             raise ManagerError(f"UUID重复: {workable.uuid}")
+        
+        self._register_unchecked(workable)
+    
+    def bulk_register(self, workables: Iterable[Workable]) -> None:
+        """
+        批量注册工作单元，先整体校验再一次性合并到主索引
+        
+        Args:
+            workables: 要注册的工作单元集合
             
+        Raises:
+            ManagerError: 如果存在无效对象或UUID重复 (此时不会注册任何工作单元)
+        """
+        batch: Dict[str, Workable] = {}
+        for workable in workables:
+            if type(workable) not in _WORKABLE_TYPES and not isinstance(workable, Workable):
+                raise ManagerError("只能注册Workable对象")
+            if workable.uuid in self._workables or workable.uuid in batch:
+                raise ManagerError(f"UUID重复: {workable.uuid}")
+            batch[workable.uuid] = workable
+        
+        # 一次性合并，主索引只需按最终大小扩容一次
+        self._workables.update(batch)
+        for workable in batch.values():
+            self._register_unchecked(workable)
+    
+    register_many = bulk_register
+    
+    def _register_unchecked(self, workable: Workable) -> None:
+        """
+        注册工作单元，跳过类型和UUID检查 (供管理器内部已验证的路径使用)
+        
+        Args:
+            workable: 要注册的工作单元
+        """
         # 注册到主索引
         self._workables[workable.uuid] = workable
         
         # 注册到名称索引
-        if workable.name not in self._workable_by_name:
-            self._workable_by_name[workable.name] = set()
-        self._workable_by_name[workable.name].add(workable.uuid)
+        self._workable_by_name.setdefault(workable.name, set()).add(workable.uuid)
+        
+        # 注册到类型索引
+        if workable.is_atom_flag:
+            self._atoms[workable.uuid] = workable
+        else:
+            self._composites[workable.uuid] = workable
         
         # 设置管理器引用
         workable.manager = self
         
-        self.logger.debug(f"注册Workable: {workable.uuid} ({workable.name})")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("注册Workable: %s (%s)", workable.uuid, workable.name)
         
     def create_workable(self, name: str, logic_description: str, is_atom: bool = True,
                       content: str = None, content_type: str = "code") -> Workable:
@@ -71,27 +124,30 @@ class WorkableManager:
         Raises:
             ManagerError: 如果创建失败
         """
-        workable = Workable(
-            name=name,
-            logic_description=logic_description,
-            is_atom=is_atom,
-            content_str=content,
-            content_type=content_type,
-            manager=self
-        )
+        if self._workable_freelist:
+            # 复用已删除的实例，避免重新分配对象和属性字典
+            workable = self._workable_freelist.pop()
+            workable._reinit(name, logic_description, is_atom, content,
+                             content_type, self, _new_uuid())
+        else:
+            workable = Workable(
+                name=name,
+                logic_description=logic_description,
+                is_atom=is_atom,
+                content_str=content,
+                content_type=content_type,
+                manager=self
+            )
         
-        try:
-            self.register(workable)
-        except ManagerError as e:
-            # 尝试处理UUID冲突
-            if "UUID重复" in str(e):
-                self.logger.warning(f"UUID冲突，重新生成: {workable.uuid}")
-                workable.uuid = str(uuid.uuid4())
-                self.register(workable)
-            else:
-                raise
+        # 处理UUID冲突: 注册前直接检查，无需通过异常消息判断
+        if workable.uuid in self._workables:
+            logger.warning("UUID冲突，重新生成: %s", workable.uuid)
+            workable.uuid = sys.intern(_new_uuid())
+            workable._uuid_short = workable.uuid[:6]
+        self._register_unchecked(workable)
         
-        self.logger.info(f"创建{'原子' if is_atom else '复合'}工作单元: {workable.uuid} ({workable.name})")
+        logger.info("创建%s工作单元: %s (%s)", '原子' if is_atom else '复合',
+                    workable.uuid, workable.name)
         return workable
     
     def create_simple(self, name: str, logic_description: str, 
@@ -155,11 +211,11 @@ class WorkableManager:
         Returns:
             工作单元列表
         """
-        if name not in self._workable_by_name:
+        bucket = self._workable_by_name.get(name)
+        if not bucket:
             return []
             
-        return [self._workables[uuid] for uuid in self._workable_by_name[name] 
-                if uuid in self._workables]
+        return [self._workables[uuid] for uuid in bucket if uuid in self._workables]
     
     def get_all(self) -> List[Workable]:
         """
@@ -177,7 +233,7 @@ class WorkableManager:
         Returns:
             简单工作单元列表
         """
-        return [w for w in self._workables.values() if w.is_atom()]
+        return list(self._atoms.values())
     
     def get_complex_workables(self) -> List[Workable]:
         """
@@ -186,44 +242,216 @@ class WorkableManager:
         Returns:
             复杂工作单元列表
         """
-        return [w for w in self._workables.values() if not w.is_atom()]
+        return list(self._composites.values())
     
-    def delete(self, uuid: str) -> bool:
+    def _update_type_index(self, workable: Workable) -> None:
+        """
+        在工作单元完成原子/复合状态转换后同步类型索引
+        
+        Args:
+            workable: 状态发生变化的工作单元
+        """
+        if self._workables.get(workable.uuid) is not workable:
+            return
+        if workable.is_atom_flag:
+            self._composites.pop(workable.uuid, None)
+            self._atoms[workable.uuid] = workable
+        else:
+            self._atoms.pop(workable.uuid, None)
+            self._composites[workable.uuid] = workable
+    
+    def delete(self, uuid: str, recycle: bool = False) -> bool:
         """
         删除工作单元
         
         Args:
             uuid: 工作单元UUID
+            recycle: 是否将实例回收到空闲列表供create_workable复用。仅当调用方
+                确认没有其他地方再持有该实例时才能设为True，回收的实例会被重置。
+                仍被已注册工作单元的子Workable表或本地Workable表引用时不会回收
             
         Returns:
             是否成功删除
         """
-        if uuid not in self._workables:
-            self.logger.warning(f"尝试删除不存在的工作单元: {uuid}")
+        workable = self._workables.pop(uuid, None)
+        if workable is None:
+            logger.warning("尝试删除不存在的工作单元: %s", uuid)
             return False
-            
-        workable = self._workables[uuid]
         
         # 从名称索引中删除
-        if workable.name in self._workable_by_name:
-            self._workable_by_name[workable.name].discard(uuid)
-            if not self._workable_by_name[workable.name]:
+        bucket = self._workable_by_name.get(workable.name)
+        if bucket is not None:
+            bucket.discard(uuid)
+            if not bucket:
                 del self._workable_by_name[workable.name]
         
-        # 从主索引中删除
-        del self._workables[uuid]
+        # 从类型索引中删除
+        self._atoms.pop(uuid, None)
+        self._composites.pop(uuid, None)
+        
+        # 由调用方显式声明可回收，管理器不推断实例是否仍被外部持有；
+        # 但仍被父Workable引用的实例重置后会被父Workable继续返回，不能回收
+        if recycle and len(self._workable_freelist) < _FREELIST_MAX:
+            if self._is_referenced(uuid):
+                logger.warning("工作单元仍被其他工作单元引用，不回收: %s", uuid)
+            else:
+                workable._reset_for_reuse()
+                self._workable_freelist.append(workable)
         
-        self.logger.info(f"删除工作单元: {uuid}")
+        logger.info("删除工作单元: %s", uuid)
         return True
     
+    def _is_referenced(self, uuid: str) -> bool:
+        """
+        检查已注册的工作单元是否在子Workable表或本地Workable表中引用了指定UUID
+        
+        Args:
+            uuid: 工作单元UUID
+            
+        Returns:
+            是否仍被引用
+        """
+        for workable in self._workables.values():
+            children = workable._children
+            if children and uuid in children:
+                return True
+            locals_ = workable._locals
+            if locals_ and uuid in locals_:
+                return True
+        return False
+    
     def clear(self) -> None:
         """
         清空所有工作单元
         """
         self._workables.clear()
         self._workable_by_name.clear()
+        self._atoms.clear()
+        self._composites.clear()
+        self._workable_freelist.clear()
+        
+        logger.info("清空所有工作单元")
+    
+    # 兼容旧版API
+    
+    @property
+    def workables(self) -> Dict[str, Workable]:
+        """兼容旧版API的UUID -> Workable主索引"""
+        return self._workables
+    
+    def register_workable(self, workable: Workable) -> None:
+        """
+        注册工作单元 (兼容旧版API)
+        
+        Args:
+            workable: 要注册的工作单元
+            
+        Raises:
+            ManagerError: 如果工作单元无效或UUID已存在
+        """
+        self.register(workable)
+    
+    def unregister_workable(self, uuid: str) -> bool:
+        """
+        注销工作单元 (兼容旧版API)
+        
+        Args:
+            uuid: 工作单元UUID
+            
+        Returns:
+            是否成功注销
+        """
+        return self.delete(uuid)
+    
+    delete_workable = unregister_workable
+    
+    def get_all_workables(self) -> Mapping[str, Workable]:
+        """
+        获取所有工作单元的只读映射，不复制字典 (兼容旧版API)
         
-        self.logger.info("清空所有工作单元")
+        Returns:
+            UUID到工作单元的只读映射
+        """
+        return types.MappingProxyType(self._workables)
+    
+    def get_workables_by_type(self, is_atom: bool) -> Dict[str, Workable]:
+        """
+        按模式获取工作单元 (兼容旧版API)
+        
+        Args:
+            is_atom: True获取原子模式，False获取复合模式
+            
+        Returns:
+            UUID到工作单元的字典
+        """
+        return (self._atoms if is_atom else self._composites).copy()
+    
+    def update_workable(self, uuid: str, name: str = None,
+                        logic_description: str = None) -> bool:
+        """
+        更新工作单元基本信息并同步名称索引 (兼容旧版API)
+        
+        Args:
+            uuid: 工作单元UUID
+            name: 新的名称
+            logic_description: 新的逻辑描述
+            
+        Returns:
+            是否成功更新
+        """
+        workable = self._workables.get(uuid)
+        if workable is None:
+            logger.warning("尝试更新不存在的工作单元: %s", uuid)
+            return False
+        
+        if name and name != workable.name:
+            bucket = self._workable_by_name.get(workable.name)
+            if bucket is not None:
+                bucket.discard(uuid)
+                if not bucket:
+                    del self._workable_by_name[workable.name]
+            self._workable_by_name.setdefault(name, set()).add(uuid)
+        
+        workable.update(name=name, logic_description=logic_description)
+        return True
+    
+    def update_simple_workable_content(self, uuid: str, content: str) -> bool:
+        """
+        更新原子模式工作单元的内容 (兼容旧版API)
+        
+        Args:
+            uuid: 工作单元UUID
+            content: 新的内容字符串
+            
+        Returns:
+            是否成功更新，工作单元不存在或不是原子模式时返回False
+        """
+        workable = self._atoms.get(uuid)
+        if workable is None:
+            logger.warning("尝试更新不存在的原子工作单元内容: %s", uuid)
+            return False
+        
+        workable.update_content(content)
+        return True
+    
+    def create_simple_workable(self, name: str, logic_description: str,
+                               content_str: str = None, content_type: str = "code") -> str:
+        """
+        创建原子模式工作单元 (兼容旧版API)
+        
+        Returns:
+            新工作单元的UUID
+        """
+        return self.create_simple(name, logic_description, content_str, content_type).uuid
+    
+    def create_complex_workable(self, name: str, logic_description: str) -> str:
+        """
+        创建复合模式工作单元 (兼容旧版API)
+        
+        Returns:
+            新工作单元的UUID
+        """
+        return self.create_complex(name, logic_description).uuid
     
     def to_dict(self) -> Dict[str, Any]:
         """
@@ -234,8 +462,8 @@ class WorkableManager:
         """
         return {
             "workable_count": len(self._workables),
-            "simple_count": len(self.get_simple_workables()),
-            "complex_count": len(self.get_complex_workables()),
+            "simple_count": len(self._atoms),
+            "complex_count": len(self._composites),
         }
     
     def __repr__(self) -> str:
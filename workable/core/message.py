@@ -3,36 +3,50 @@
 """
 
 import logging
-from typing import List, Optional, Dict
+from collections import deque
+from typing import Deque, Dict, Iterable, List, Optional
 
-from workable.core.models import Message
+from workable.core.models import (
+    Message, STATUS_INBOX, STATUS_PROCESSING, STATUS_ARCHIVE, STATUS_ARCHIVED
+)
 from workable.core.exceptions import MessageError
 
+logger = logging.getLogger(__name__)
+
+# 消息管理器接受的状态，以及存放在已归档列表中的状态
+_ACCEPTED_STATUSES = frozenset((STATUS_INBOX, STATUS_PROCESSING, STATUS_ARCHIVE, STATUS_ARCHIVED))
+_ARCHIVED_LIST_STATUSES = frozenset((STATUS_ARCHIVED, STATUS_ARCHIVE, STATUS_PROCESSING))
+_ARCHIVE_STATUSES = frozenset((STATUS_ARCHIVE, STATUS_ARCHIVED))
+
 class MessageManager:
     """
     消息管理器 - 管理与Workable相关的消息
     """
     
+    __slots__ = ('inbox', 'archived', '_processing', '_by_id')
+    
     def __init__(self):
         """初始化消息管理器"""
-        self.inbox = []  # type: List[Message]
+        self.inbox = deque()  # type: Deque[Message]  # 先进先出队列，process_next从队首取出
         self.archived = []  # type: List[Message]
-        self.logger = logging.getLogger(__name__)
         
         # 兼容旧版API的属性
         self._processing = []  # 旧版API使用的处理中列表
+        
+        # 消息ID索引，覆盖收件箱和已归档列表中的所有消息
+        self._by_id = {}  # type: Dict[str, Message]
     
     @property
     def processing(self):
         """兼容旧版API的处理中消息列表"""
-        return [msg for msg in self.archived if msg.status == "processing"]
+        return [msg for msg in self.archived if msg.status == STATUS_PROCESSING]
     
     @property
     def archive(self):
         """兼容旧版API的归档消息列表"""
-        return [msg for msg in self.archived if msg.status == "archive"]
+        return [msg for msg in self.archived if msg.status == STATUS_ARCHIVE]
     
-    def append(self, message: Message) -> None:
+    def append_message(self, message: Message) -> None:
         """
         添加消息到收件箱
         
@@ -42,32 +56,62 @@ class MessageManager:
         Raises:
             MessageError: 如果消息对象无效
         """
-        self.append_message(message)
+        if not isinstance(message, Message):
+            raise MessageError(f"无效的消息对象: {message}")
+        
+        self._append_unchecked(message)
     
-    def append_message(self, message: Message) -> None:
+    append = append_message
+    
+    def extend_messages(self, messages: Iterable[Message]) -> None:
         """
-        添加消息到收件箱
+        批量添加消息，先整体校验再按状态一次性合并到收件箱和已归档列表
         
         Args:
-            message: 要添加的消息
+            messages: 要添加的消息集合
             
         Raises:
-            MessageError: 如果消息对象无效
+            MessageError: 如果存在无效的消息对象 (此时不会添加任何消息)
         """
-        if not isinstance(message, Message):
-            raise MessageError(f"无效的消息对象: {message}")
+        batch = list(messages)
+        for message in batch:
+            if not isinstance(message, Message):
+                raise MessageError(f"无效的消息对象: {message}")
         
+        inbox_batch = []
+        archived_batch = []
+        for message in batch:
+            if message.status in _ARCHIVED_LIST_STATUSES:
+                archived_batch.append(message)
+            else:
+                message.status = STATUS_INBOX
+                inbox_batch.append(message)
+        
+        self.inbox.extend(inbox_batch)
+        self.archived.extend(archived_batch)
+        self._by_id.update((message.id, message) for message in batch)
+        logger.info("批量添加消息: %d 条", len(batch))
+    
+    def _append_unchecked(self, message: Message) -> None:
+        """
+        添加消息，跳过类型检查 (供内部已验证的路径使用)
+        
+        Args:
+            message: 要添加的消息
+        """
         # 设置消息状态为inbox（如果未指定）
-        if not message.status or message.status not in ["inbox", "processing", "archive", "archived"]:
-            message.status = "inbox"
+        if message.status not in _ACCEPTED_STATUSES:
+            message.status = STATUS_INBOX
             
         # 添加消息到收件箱或已归档列表
-        if message.status in ["archived", "archive", "processing"]:
+        if message.status in _ARCHIVED_LIST_STATUSES:
             self.archived.append(message)
         else:
             self.inbox.append(message)
+        self._by_id[message.id] = message
             
-        self.logger.info(f"添加消息: {message.content[:20]}...")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("添加消息: %s...", message._preview)
     
     def process_next(self) -> Optional[Message]:
         """
@@ -77,14 +121,15 @@ class MessageManager:
             处理的消息，如果没有消息则返回None
         """
         if not self.inbox:
-            self.logger.warning("尝试处理空收件箱")
+            logger.warning("尝试处理空收件箱")
             return None
         
-        message = self.inbox.pop(0)
-        message.status = "processing"  # 兼容旧版状态
+        message = self.inbox.popleft()
+        message.status = STATUS_PROCESSING  # 兼容旧版状态
         self.archived.append(message)
         
-        self.logger.info(f"处理消息: {message.content[:20]}...")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("处理消息: %s...", message._preview)
         return message
     
     def archive_message(self, message_id: str) -> bool:
@@ -97,22 +142,32 @@ class MessageManager:
         Returns:
             是否成功归档
         """
-        # 从收件箱中查找消息
-        for i, message in enumerate(self.inbox):
-            if message.id == message_id:
-                message.status = "archive"  # 兼容旧版状态
-                self.archived.append(self.inbox.pop(i))
-                self.logger.info(f"归档收件箱消息: {message.content[:20]}...")
-                return True
+        # 通过ID索引定位消息，只有收件箱中的消息需要移动
+        message = self._by_id.get(message_id)
         
-        # 从处理中状态查找消息
-        for message in self.archived:
-            if message.id == message_id and message.status == "processing":
-                message.status = "archive"
-                self.logger.info(f"归档处理中消息: {message.content[:20]}...")
-                return True
+        if message is not None and message.status == STATUS_INBOX:
+            inbox = self.inbox
+            # 通常按先进先出顺序归档，命中队首时直接出队，否则按身份查找
+            if inbox and inbox[0] is message:
+                inbox.popleft()
+            else:
+                for i, queued in enumerate(inbox):
+                    if queued is message:
+                        del inbox[i]
+                        break
+            message.status = STATUS_ARCHIVE  # 兼容旧版状态
+            self.archived.append(message)
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("归档收件箱消息: %s...", message._preview)
+            return True
+        
+        if message is not None and message.status == STATUS_PROCESSING:
+            message.status = STATUS_ARCHIVE
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("归档处理中消息: %s...", message._preview)
+            return True
                 
-        self.logger.warning(f"尝试归档不存在的消息: {message_id}")
+        logger.warning("尝试归档不存在的消息: %s", message_id)
         return False
     
     def get_inbox(self) -> List[Message]:
@@ -122,7 +177,7 @@ class MessageManager:
         Returns:
             收件箱消息列表
         """
-        return self.inbox.copy()
+        return list(self.inbox)
     
     def get_archived(self) -> List[Message]:
         """
@@ -131,7 +186,7 @@ class MessageManager:
         Returns:
             已归档消息列表
         """
-        return [msg for msg in self.archived if msg.status in ["archive", "archived"]]
+        return [msg for msg in self.archived if msg.status in _ARCHIVE_STATUSES]
     
     def get_all_messages(self) -> List[Message]:
         """
@@ -140,7 +195,14 @@ class MessageManager:
         Returns:
             所有消息列表
         """
-        return self.inbox.copy() + self.archived.copy()
+        return [*self.inbox, *self.archived]
+    
+    # 状态名到查询方法的映射，按状态查询时只需一次字典查找
+    _STATUS_GETTERS = {
+        STATUS_INBOX: get_inbox,
+        STATUS_PROCESSING: processing.fget,
+        STATUS_ARCHIVE: get_archived,
+    }
     
     def get_messages_by_status(self, status: str) -> List[Message]:
         """
@@ -155,15 +217,12 @@ class MessageManager:
         Raises:
             ValueError: 如果状态值无效
         """
-        if status not in ["inbox", "processing", "archive"]:
-            raise ValueError(f"无效的消息状态: {status}")
-            
-        if status == "inbox":
-            return self.inbox.copy()
-        elif status == "processing":
-            return [msg for msg in self.archived if msg.status == "processing"]
-        else:  # archive
-            return [msg for msg in self.archived if msg.status in ["archive", "archived"]]
+        try:
+            getter = self._STATUS_GETTERS[status]
+        except KeyError:
+            raise ValueError(f"无效的消息状态: {status}") from None
+        
+        return getter(self)
     
     def get_message_by_id(self, message_id: str) -> Optional[Message]:
         """
@@ -175,31 +234,37 @@ class MessageManager:
         Returns:
             消息对象，如果不存在则返回None
         """
-        for message in self.inbox + self.archived:
-            if message.id == message_id:
-                return message
-        return None
+        return self._by_id.get(message_id)
     
     def clear_inbox(self) -> None:
         """清空收件箱"""
+        for message in self.inbox:
+            self._by_id.pop(message.id, None)
         self.inbox.clear()
-        self.logger.info("清空收件箱")
+        logger.info("清空收件箱")
     
     def clear_processing(self) -> None:
         """清空处理中队列（兼容旧版API）"""
-        self.archived = [msg for msg in self.archived if msg.status != "processing"]
-        self.logger.info("清空处理中队列")
+        for message in self.archived:
+            if message.status == STATUS_PROCESSING:
+                self._by_id.pop(message.id, None)
+        self.archived = [msg for msg in self.archived if msg.status != STATUS_PROCESSING]
+        logger.info("清空处理中队列")
     
     def clear_archive(self) -> None:
         """清空归档队列（兼容旧版API）"""
-        self.archived = [msg for msg in self.archived if msg.status not in ["archive", "archived"]]
-        self.logger.info("清空归档队列")
+        for message in self.archived:
+            if message.status in _ARCHIVE_STATUSES:
+                self._by_id.pop(message.id, None)
+        self.archived = [msg for msg in self.archived if msg.status not in _ARCHIVE_STATUSES]
+        logger.info("清空归档队列")
     
     def clear_all(self) -> None:
         """清空所有消息(收件箱和已归档)"""
         self.inbox.clear()
         self.archived.clear()
-        self.logger.info("清空所有消息")
+        self._by_id.clear()
+        logger.info("清空所有消息")
     
     # 兼容旧版API
     clear_messages = clear_all 
\ No newline at end of file
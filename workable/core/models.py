@@ -5,7 +5,59 @@ Workable基础数据模型 - 定义系统中使用的基础数据模型
 
 from dataclasses import dataclass, field
 from typing import Dict, List, Optional, Union, Any
-import uuid
+import os
+import sys
+
+# Python 3.10+ 的dataclass支持直接生成__slots__
+_DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+# 框架类型常量 (驻留字符串，比较时可直接命中身份判断)
+FRAME_REFERENCE = sys.intern("reference")
+FRAME_CHILD = sys.intern("child")
+FRAME_LOCAL = sys.intern("local")
+
+# 消息状态常量 (驻留字符串，比较时可直接命中身份判断)
+STATUS_INBOX = sys.intern("inbox")
+STATUS_PROCESSING = sys.intern("processing")
+STATUS_ARCHIVE = sys.intern("archive")
+STATUS_ARCHIVED = sys.intern("archived")
+
+# 消息的有效状态 (集合成员判断为O(1))
+_VALID_STATUSES = frozenset((STATUS_INBOX, STATUS_PROCESSING, STATUS_ARCHIVE))
+
+# 模块级绑定，生成标识时免去属性查找
+_urandom = os.urandom
+
+def _new_uuid() -> str:
+    """
+    生成新的Workable标识或消息ID (128位随机数的32位十六进制形式)
+    
+    直接使用os.urandom，省去构造uuid.UUID对象的开销
+    
+    Returns:
+        32位十六进制字符串
+    """
+    return _urandom(16).hex()
+
+# 只驻留短于此长度的字符串
+_INTERN_MAX_LEN = 20
+
+def _intern_str(text):
+    """
+    驻留内容类型、简短逻辑描述等重复率高的短字符串，使内容相同的字符串共享同一个对象
+    
+    只驻留短字符串: 部分CPython版本 (如3.12) 中驻留的字符串不会被释放，
+    对任意长度的描述文本驻留会让每段不同的文本常驻内存。
+    
+    Args:
+        text: 要驻留的字符串
+        
+    Returns:
+        驻留后的字符串；非str对象或较长的字符串原样返回
+    """
+    if type(text) is str and len(text) < _INTERN_MAX_LEN:
+        return sys.intern(text)
+    return text
 
 class WorkableFrame:
     """
@@ -14,11 +66,16 @@ class WorkableFrame:
     作为workable框架级别设计中的核心索引实体，管理引用和顺序
     """
     
+    __slots__ = ('name', 'logic_description', 'seq', 'frame_type', 'exref', 'metadata',
+                 'snapshot', 'lnref', '_is_local', '_is_external')
+    
     def __init__(self, name: str, logic_description: str, 
                  seq: int = 0,
-                 frame_type: str = "reference", 
+                 frame_type: str = FRAME_REFERENCE, 
                  exref: Optional[str] = None,
-                 metadata: Optional[Dict[str, Any]] = None):
+                 metadata: Optional[Dict[str, Any]] = None,
+                 snapshot: Optional[str] = None,
+                 lnref: Optional[str] = None):
         """
         初始化WorkableFrame
         
@@ -29,13 +86,21 @@ class WorkableFrame:
             frame_type: 框架类型 (reference, child, local)
             exref: 外部引用UUID
             metadata: 元数据字典
+            snapshot: 被引用Workable的内容快照
+            lnref: 本地引用UUID
         """
         self.name = name
-        self.logic_description = logic_description
+        self.logic_description = _intern_str(logic_description)
         self.seq = seq  # 序列号用于在Content中的有序存储
-        self.frame_type = frame_type  # 框架类型
+        self.frame_type = sys.intern(frame_type)  # 框架类型
         self.exref = exref  # 外部引用UUID
         self.metadata = metadata or {}  # 元数据字典
+        self.snapshot = snapshot  # 内容快照
+        self.lnref = lnref  # 本地引用UUID
+        
+        # 类型和引用在构造后不再变化，预先计算常用的判断结果
+        self._is_local = self.frame_type == FRAME_LOCAL
+        self._is_external = exref is not None and not self._is_local
         
     def is_external(self) -> bool:
         """
@@ -44,7 +109,7 @@ class WorkableFrame:
         Returns:
             是否为外部引用
         """
-        return self.exref is not None and self.frame_type != "local"
+        return self._is_external
         
     def is_local(self) -> bool:
         """
@@ -53,7 +118,7 @@ class WorkableFrame:
         Returns:
             是否为本地引用
         """
-        return self.frame_type == "local"
+        return self._is_local
         
     def get_reference_uuid(self) -> Optional[str]:
         """
@@ -90,43 +155,68 @@ class WorkableFrame:
     def __repr__(self) -> str:
         return f"<WorkableFrame type={self.frame_type} name={self.name} seq={self.seq}>"
 
-@dataclass
-class Message:
+class _MessageCache:
+    """为Message提供不属于数据字段的缓存槽位 (不会出现在asdict等序列化结果中)"""
+    
+    __slots__ = ('_preview_cache',)
+
+@dataclass(**_DATACLASS_SLOTS)
+class Message(_MessageCache):
     """
     消息对象，用于在Workable之间传递任务或信息
     """
     content: str
     sender: str
     receiver: str
-    status: str = "inbox"  # inbox, processing, archive
-    id: str = field(default_factory=lambda: str(uuid.uuid4()))
+    status: str = STATUS_INBOX  # inbox, processing, archive
+    id: str = field(default_factory=_new_uuid)
     
     def __post_init__(self):
         """验证消息状态是否有效"""
-        valid_statuses = ["inbox", "processing", "archive"]
-        if self.status not in valid_statuses:
-            self.status = "inbox"
+        if self.status not in _VALID_STATUSES:
+            self.status = STATUS_INBOX
+        else:
+            self.status = sys.intern(self.status)
+    
+    @property
+    def _preview(self) -> str:
+        """日志用的内容摘要，首次访问时才切片并缓存"""
+        try:
+            return self._preview_cache
+        except AttributeError:
+            preview = self._preview_cache = self.content[:20]
+            return preview
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class Relation:
     """
     关系模型
+    
+    RelationManager以target_uuid为键管理关系，源UUID和关系类型可省略
     """
+    source_uuid: Optional[str] = None
+    target_uuid: Optional[str] = None
+    relation_type: str = ""
+    description: str = ""
+    meta: Dict[str, Any] = field(default_factory=dict)
+    
+    def __post_init__(self):
+        """兼容显式传入meta=None的调用"""
+        if self.meta is None:
+            self.meta = {}
     
-    def __init__(self, source_uuid: str, target_uuid: str, relation_type: str, description: str = ""):
+    def set_meta(self, key: str, value: Any) -> None:
         """
-        初始化关系
+        设置单个元数据
+        
+        仅用于尚未添加到RelationManager的关系；已添加的关系请使用
+        RelationManager.set_meta，否则元数据索引不会同步。
         
         Args:
-            source_uuid: 源UUID
-            target_uuid: 目标UUID
-            relation_type: 关系类型
-            description: 关系描述
+            key: 键
+            value: 值
         """
-        self.source_uuid = source_uuid
-        self.target_uuid = target_uuid
-        self.relation_type = relation_type
-        self.description = description
+        self.meta[key] = value
     
     def __repr__(self) -> str:
         return f"<Relation {self.source_uuid}-{self.relation_type}->{self.target_uuid}>" 
\ No newline at end of file
@@ -3,20 +3,85 @@
 """
 
 import logging
-from typing import Dict, List, Optional, Any
+from typing import Dict, Iterator, List, Optional, Set, Any
 
 from workable.core.models import Relation
 from workable.core.exceptions import RelationError
 
+logger = logging.getLogger(__name__)
+
 class RelationManager:
     """
     关系管理器 - 管理Workable之间的关系
     """
     
+    __slots__ = ('relations', '_meta_index', '_indexed')
+    
     def __init__(self):
         """初始化关系管理器"""
         self.relations = {}  # type: Dict[str, Relation]
-        self.logger = logging.getLogger(__name__)
+        self._meta_index = {}  # type: Dict[str, Dict[Any, Set[str]]]  # 元数据键 -> 值 -> 目标UUID集合
+        # 每个目标实际进入索引的元数据值，移除索引时以此为准而不是关系当前的元数据
+        self._indexed = {}  # type: Dict[str, Dict[str, Any]]  # 目标UUID -> 键 -> 值
+    
+    def register_meta_key(self, key: str) -> None:
+        """
+        为元数据键建立倒排索引，使get_related_by_meta对该键无需线性扫描
+        
+        只有可哈希的元数据值会进入索引，其余值仍由get_related_by_meta扫描处理。
+        
+        Args:
+            key: 要建立索引的元数据键
+        """
+        if key in self._meta_index:
+            return
+        
+        self._meta_index[key] = {}
+        for target_uuid, relation in self.relations.items():
+            self._index_meta_value(key, relation.meta, target_uuid)
+    
+    def _index_meta_value(self, key: str, meta: Dict, target_uuid: str) -> None:
+        """将关系的元数据值加入指定键的索引"""
+        if key not in meta:
+            return
+        value = meta[key]
+        try:
+            self._meta_index[key].setdefault(value, set()).add(target_uuid)
+        except TypeError:
+            return  # 不可哈希的值不进入索引
+        self._indexed.setdefault(target_uuid, {})[key] = value
+    
+    def _indexable_meta(self, meta: Dict) -> Dict[str, Any]:
+        """返回元数据中会进入索引的键值 (已注册的键且值可哈希)"""
+        values = {}
+        for key in self._meta_index:
+            if key not in meta:
+                continue
+            value = meta[key]
+            try:
+                hash(value)
+            except TypeError:
+                continue
+            values[key] = value
+        return values
+    
+    def _index_meta(self, target_uuid: str, meta: Dict) -> None:
+        """将关系的元数据加入所有已注册键的索引"""
+        for key in self._meta_index:
+            self._index_meta_value(key, meta, target_uuid)
+    
+    def _unindex_meta(self, target_uuid: str) -> None:
+        """按记录的索引值将目标从所有已注册键的索引中移除"""
+        indexed = self._indexed.pop(target_uuid, None)
+        if not indexed:
+            return
+        for key, value in indexed.items():
+            index = self._meta_index[key]
+            bucket = index.get(value)
+            if bucket is not None:
+                bucket.discard(target_uuid)
+                if not bucket:
+                    del index[value]
     
     def add(self, relation: Relation) -> None:
         """
@@ -33,10 +98,16 @@ class RelationManager:
         
         # 如果同一目标已有关系，则覆盖
         if relation.target_uuid in self.relations:
-            self.logger.info(f"覆盖已存在的关系: {relation.target_uuid}")
+            logger.info("覆盖已存在的关系: %s", relation.target_uuid)
         
         self.relations[relation.target_uuid] = relation
-        self.logger.info(f"添加关系: {relation.target_uuid}")
+        
+        # 与已记录的索引值一致时索引无需变动
+        if self._meta_index and (self._indexed.get(relation.target_uuid, {})
+                                 != self._indexable_meta(relation.meta)):
+            self._unindex_meta(relation.target_uuid)
+            self._index_meta(relation.target_uuid, relation.meta)
+        logger.info("添加关系: %s", relation.target_uuid)
     
     def remove(self, target_uuid: str) -> bool:
         """
@@ -50,10 +121,12 @@ class RelationManager:
         """
         if target_uuid in self.relations:
             del self.relations[target_uuid]
-            self.logger.info(f"移除关系: {target_uuid}")
+            if self._meta_index:
+                self._unindex_meta(target_uuid)
+            logger.info("移除关系: %s", target_uuid)
             return True
         else:
-            self.logger.warning(f"尝试移除不存在的关系: {target_uuid}")
+            logger.warning("尝试移除不存在的关系: %s", target_uuid)
             return False
     
     def update_meta(self, target_uuid: str, meta: Dict) -> bool:
@@ -67,14 +140,48 @@ class RelationManager:
         Returns:
             是否成功更新
         """
-        if target_uuid in self.relations:
-            self.relations[target_uuid].meta.clear()
-            self.relations[target_uuid].meta.update(meta)
-            self.logger.info(f"更新关系元数据: {target_uuid}")
-            return True
-        else:
-            self.logger.warning(f"尝试更新不存在的关系元数据: {target_uuid}")
+        relation = self.relations.get(target_uuid)
+        if relation is None:
+            logger.warning("尝试更新不存在的关系元数据: %s", target_uuid)
+            return False
+        
+        if self._meta_index:
+            self._unindex_meta(target_uuid)
+        # 新元数据整体替换旧元数据，直接换成新字典
+        relation.meta = dict(meta)
+        if self._meta_index:
+            self._index_meta(target_uuid, relation.meta)
+        logger.info("更新关系元数据: %s", target_uuid)
+        return True
+    
+    def set_meta(self, target_uuid: str, key: str, value: Any) -> bool:
+        """
+        设置关系的单个元数据，并同步元数据索引
+        
+        已添加到管理器的关系应通过此方法修改元数据，直接修改relation.meta不会更新索引。
+        
+        Args:
+            target_uuid: 目标Workable的UUID
+            key: 键
+            value: 值
+            
+        Returns:
+            是否成功设置
+        """
+        relation = self.relations.get(target_uuid)
+        if relation is None:
+            logger.warning("尝试设置不存在的关系元数据: %s", target_uuid)
             return False
+        
+        # 只有已建立索引的键需要重建该目标的索引
+        reindex = key in self._meta_index
+        if reindex:
+            self._unindex_meta(target_uuid)
+        relation.set_meta(key, value)
+        if reindex:
+            self._index_meta(target_uuid, relation.meta)
+        logger.info("设置关系元数据: %s", target_uuid)
+        return True
     
     def has_relation(self, target_uuid: str) -> bool:
         """
@@ -109,6 +216,15 @@ class RelationManager:
         """
         return list(self.relations.values())
     
+    def iter_all(self) -> Iterator[Relation]:
+        """
+        遍历所有关系，不复制列表 (遍历期间不要增删关系)
+        
+        Returns:
+            关系迭代器
+        """
+        return iter(self.relations.values())
+    
     def get_related(self) -> List[str]:
         """
         获取所有相关Workable的UUID
@@ -118,6 +234,15 @@ class RelationManager:
         """
         return list(self.relations.keys())
     
+    def iter_related(self) -> Iterator[str]:
+        """
+        遍历所有相关Workable的UUID，不复制列表 (遍历期间不要增删关系)
+        
+        Returns:
+            相关Workable UUID的迭代器
+        """
+        return iter(self.relations)
+    
     def get_relation(self, target_uuid: str) -> Optional[Relation]:
         """
         获取指定关系（兼容旧API）
@@ -141,6 +266,21 @@ class RelationManager:
         Returns:
             符合条件的关系字典
         """
+        index = self._meta_index.get(key)
+        if index is not None:
+            try:
+                bucket = index.get(value, ())
+            except TypeError:
+                bucket = None  # 不可哈希的查询值退回线性扫描
+            if bucket is not None:
+                relations = self.relations
+                result = {}
+                for uuid in bucket:
+                    relation = relations.get(uuid)
+                    if relation is not None:
+                        result[uuid] = relation
+                return result
+        
         result = {}
         for uuid, relation in self.relations.items():
             if key in relation.meta and relation.meta[key] == value:
@@ -150,7 +290,10 @@ class RelationManager:
     def clear(self) -> None:
         """清空所有关系"""
         self.relations.clear()
-        self.logger.info("所有关系已清空")
+        for index in self._meta_index.values():
+            index.clear()
+        self._indexed.clear()
+        logger.info("所有关系已清空")
     
     # 兼容旧版API
     clear_all = clear 
\ No newline at end of file
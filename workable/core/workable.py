@@ -3,22 +3,36 @@ Workable核心模块 - 定义统一的Workable类，通过内部状态区分简
 实现基于索引的工作单元管理，分离对象引用和内容存储
 """
 
+import sys
+import types
 import uuid
 import logging
-from typing import Dict, List, Optional, Union, Any, Set
+from typing import Dict, Iterable, List, Mapping, Optional, Union, Any, Set
 
-from workable.core.models import WorkableFrame, Relation
+from workable.core.models import WorkableFrame, Relation, _intern_str, _new_uuid
 from workable.core.content import Content
 from workable.core.message import MessageManager
 from workable.core.relation import RelationManager
 from workable.core.exceptions import WorkableError, ConversionError
 
+logger = logging.getLogger('workable')
+
 class Workable:
     """
-    统一的Workable类，通过内部状态区分简单(原子/γ-workable)和复杂(复合/α-workable)模式
+    统一的Workable类，区分简单(原子/γ-workable)和复杂(复合/α-workable)模式
     通过索引机制管理子Workable和本地Workable，实现解耦存储
+    
+    实例的实际类型始终是SimpleWorkable或ComplexWorkable，模式转换时原地切换__class__，
+    各模式专有的方法由子类实现，本类中的同名方法只负责在错误模式下报错
     """
     
+    __slots__ = (
+        'uuid', '_uuid_short', 'name', 'logic_description', 'content',
+        '_message_manager', '_relation_manager', 'manager',
+        '_children', '_locals', 'is_local', 'is_converted_content',
+        '_converted_content_uuid',
+    )
+    
     def __init__(self, name: str, logic_description: str, is_atom: bool = True,
                  content_str: str = None, content_type: str = "code",
                  manager = None):
@@ -33,13 +47,31 @@ class Workable:
             content_type: 内容类型 (仅在简单模式下使用)
             manager: 可选的WorkableManager实例，用于索引查找
         """
-        self.uuid = str(uuid.uuid4())
+        self._reinit(name, logic_description, is_atom, content_str, content_type,
+                     manager, _new_uuid())
+    
+    def _reinit(self, name: str, logic_description: str, is_atom: bool,
+                content_str: Optional[str], content_type: str, manager,
+                new_uuid: str) -> None:
+        """
+        (重新)初始化全部字段，供构造函数和管理器的空闲列表复用
+        
+        Args:
+            name: Workable名称
+            logic_description: 逻辑描述
+            is_atom: 是否为原子Workable (简单模式)
+            content_str: 内容字符串 (仅在简单模式下使用)
+            content_type: 内容类型 (仅在简单模式下使用)
+            manager: 可选的WorkableManager实例
+            new_uuid: 分配给该Workable的UUID
+        """
+        self.__class__ = SimpleWorkable if is_atom else ComplexWorkable
+        self.uuid = sys.intern(new_uuid)  # 驻留UUID，各索引字典共享同一个字符串对象
+        self._uuid_short = new_uuid[:6]  # __repr__ 使用的UUID前缀，只切片一次
         self.name = name
-        self.logic_description = logic_description
-        self.is_atom_flag = is_atom  # 内部状态标识
-        self.message_manager = MessageManager()
-        self.relation_manager = RelationManager()
-        self.logger = logging.getLogger('workable')
+        self.logic_description = _intern_str(logic_description)
+        self._message_manager: Optional[MessageManager] = None  # 首次访问时创建
+        self._relation_manager: Optional[RelationManager] = None  # 首次访问时创建
         self.manager = manager  # 用于索引查找
         
         # 内容管理（所有Workable都有Content）
@@ -50,10 +82,57 @@ class Workable:
             # 复杂模式或无内容: 空内容容器
             self.content = Content()
         
-        # 缓存引用 (为保持向后兼容)
-        self._child_references: Dict[str, 'Workable'] = {} if not is_atom else None
-        self._local_references: Dict[str, 'Workable'] = {}
+        # 子Workable和本地Workable表 (UUID -> Workable)，Content中的Frame负责索引和顺序
+        self._children: Dict[str, 'Workable'] = {} if not is_atom else None
+        self._locals: Dict[str, 'Workable'] = {}
         
+        # 本地/转换内容标记 (复用实例时同时被重置)
+        self.is_local = False
+        self.is_converted_content = False
+        self._converted_content_uuid: Optional[str] = None  # make_complex保存原内容的本地Workable
+    
+    def _reset_for_reuse(self) -> None:
+        """
+        释放内容、引用和消息/关系，使实例可以放入管理器的空闲列表
+        """
+        self.content = None
+        self.manager = None
+        self._message_manager = None
+        self._relation_manager = None
+        self._children = None
+        self._locals = None
+        
+    @property
+    def message_manager(self) -> MessageManager:
+        """消息管理器，首次访问时创建"""
+        if self._message_manager is None:
+            self._message_manager = MessageManager()
+        return self._message_manager
+    
+    @property
+    def relation_manager(self) -> RelationManager:
+        """关系管理器，首次访问时创建"""
+        if self._relation_manager is None:
+            self._relation_manager = RelationManager()
+        return self._relation_manager
+    
+    @property
+    def relation_count(self) -> int:
+        """关系数量，尚未创建关系管理器时直接返回0而不创建"""
+        if self._relation_manager is None:
+            return 0
+        return len(self._relation_manager.relations)
+    
+    @property
+    def str_uuid(self) -> str:
+        """
+        获取带连字符的标准UUID字符串 (仅用于显示和日志)
+        
+        Returns:
+            标准格式的UUID字符串
+        """
+        return str(uuid.UUID(self.uuid))
+    
     def to_frame(self, frame_type: str = "reference") -> WorkableFrame:
         """
         将当前Workable转换为Frame
@@ -70,6 +149,7 @@ class Workable:
             seq=0,  # 临时序列号，实际添加时会被修改
             frame_type=frame_type,
             exref=self.uuid,
+            lnref=self.uuid,
         )
     
     def update(self, name: str = None, logic_description: str = None) -> None:
@@ -83,19 +163,22 @@ class Workable:
         if name:
             self.name = name
         if logic_description:
+            logic_description = _intern_str(logic_description)
             self.logic_description = logic_description
         
         # 同步更新所有Frame
-        if hasattr(self, "content") and self.content:
-            if self.uuid in self.content._frames_by_uuid:
-                for seq in self.content._frames_by_uuid[self.uuid]:
-                    frame = self.content._frames_by_seq[seq]
-                    if name:
-                        frame.name = name
-                    if logic_description:
-                        frame.logic_description = logic_description
-        
-        self.logger.debug(f"更新Workable基本信息: {self.uuid}")
+        content = self.content
+        seqs = content._frames_by_uuid.get(self.uuid) if content is not None else None
+        if seqs:
+            frames_by_seq = content._frames_by_seq
+            for seq in seqs:
+                frame = frames_by_seq[seq]
+                if name:
+                    frame.name = name
+                if logic_description:
+                    frame.logic_description = logic_description
+        
+        logger.debug("更新Workable基本信息: %s", self.uuid)
     
     # 状态相关方法
     
@@ -115,7 +198,7 @@ class Workable:
         Returns:
             是否为简单Workable
         """
-        return self.is_atom()
+        return self.is_atom_flag
     
     def is_complex(self) -> bool:
         """
@@ -124,323 +207,127 @@ class Workable:
         Returns:
             是否为复杂Workable
         """
-        return not self.is_atom()
+        return not self.is_atom_flag
     
     # 状态转换方法
+    # 转换在原实例上进行，消息和关系管理器原样保留，不需要复制Message或Relation
     
     def make_complex(self) -> 'Workable':
         """
-        将简单Workable转换为复杂Workable
+        将简单Workable转换为复杂Workable (复杂模式下仅记录警告)
         
         Returns:
             转换后的Workable (self)
-            
-        Raises:
-            ConversionError: 如果转换失败
         """
-        if not self.is_atom():
-            self.logger.warning(f"Workable {self.uuid} 已经是复杂类型")
-            return self
-        
-        self.logger.info(f"开始将Workable {self.uuid} 从简单类型转换为复杂类型")
-        
-        # 将原始内容保存为本地Workable
-        original_content = self.content.content
-        original_content_type = self.content.content_type
-        
-        if original_content:
-            # 创建本地Workable保存原内容
-            local_workable = Workable(
-                name=f"{self.name}_content",
-                logic_description=self.logic_description,
-                is_atom=True,
-                content_str=original_content,
-                content_type=original_content_type,
-                manager=self.manager
-            )
-            
-            # 标记为转换后的本地内容
-            local_workable.is_converted_content = True
-            
-            # 初始化新的内容容器
-            self.content = Content()
-            
-            # 添加为本地引用 - 使用新的索引机制
-            self.add_local(local_workable)
-        
-        # 状态转换
-        self.is_atom_flag = False
-        
-        # 初始化子引用字典
-        self._child_references = {}
-        
-        self.logger.info(f"Workable {self.uuid} 已成功转换为复杂类型")
-        
+        logger.warning("Workable %s 已经是复杂类型", self.uuid)
         return self
     
     def make_simple(self) -> 'Workable':
         """
-        将复杂Workable转换为简单Workable
+        将复杂Workable转换为简单Workable (简单模式下仅记录警告)
         
         Returns:
             转换后的Workable (self)
-            
-        Raises:
-            ConversionError: 如果转换失败
         """
-        if self.is_atom():
-            self.logger.warning(f"Workable {self.uuid} 已经是简单类型")
-            return self
-        
-        # 检查是否可以转换: 必须没有子Workable
-        child_frames = self.content.get_frames_by_type("child")
-        if child_frames and len(child_frames) > 0:
-            raise ConversionError(f"无法转换含有子Workable的复杂Workable: {self.uuid}")
-        
-        # 检查是否有原始内容的本地Workable
-        content_workable = None
-        for local_uuid, local in self._local_references.items():
-            if hasattr(local, "is_converted_content") and local.is_converted_content:
-                content_workable = local
-                break
-                
-        if not content_workable:
-            # 需要有且仅有一个本地Workable作为内容
-            local_frames = self.content.get_frames_by_type("local")
-            if len(local_frames) != 1:
-                raise ConversionError(
-                    f"复杂Workable {self.uuid} 包含 {len(local_frames)} 个本地Workable，"
-                    f"无法转换为简单Workable（需要恰好1个）"
-                )
-            
-            # 获取唯一的本地Workable
-            local_uuid = local_frames[0].get_reference_uuid()
-            content_workable = self._local_references.get(local_uuid)
-            
-            if not content_workable:
-                raise ConversionError(f"找不到本地Workable: {local_uuid}")
-        
-        self.logger.info(f"开始将Workable {self.uuid} 从复杂类型转换为简单类型")
-        
-        # 从本地Workable提取内容
-        self.content = Content(
-            content_type=content_workable.content.content_type,
-            content=content_workable.content.content
-        )
-        
-        # 状态转换
-        self.is_atom_flag = True
-        self._local_references = {}  # 清空本地引用
-        self._child_references = None  # 清空子引用
-        
-        self.logger.info(f"Workable {self.uuid} 已成功转换为简单类型")
-        
+        logger.warning("Workable %s 已经是简单类型", self.uuid)
         return self
     
-    # 简单模式方法
+    # 简单模式方法 (由SimpleWorkable实现)
     
     @property
     def content_str(self) -> str:
         """
         获取内容字符串 (仅简单模式)
         
-        Returns:
-            内容字符串
-            
         Raises:
             AttributeError: 如果在复杂模式下调用
         """
-        if not self.is_atom():
-            raise AttributeError("复杂Workable没有直接内容，请使用frames或本地Workable")
-        return self.content.content
+        raise AttributeError("复杂Workable没有直接内容，请使用frames或本地Workable")
     
     @content_str.setter
     def content_str(self, value: str) -> None:
-        """
-        设置内容字符串 (仅简单模式)
-        
-        Args:
-            value: 新的内容字符串
-            
-        Raises:
-            AttributeError: 如果在复杂模式下调用
-        """
-        if not self.is_atom():
-            raise AttributeError("复杂Workable没有直接内容，请使用frames或本地Workable")
-        self.content.content = value
+        raise AttributeError("复杂Workable没有直接内容，请使用frames或本地Workable")
     
     @property
     def content_type(self) -> str:
         """
         获取内容类型 (仅简单模式)
         
-        Returns:
-            内容类型
-            
         Raises:
             AttributeError: 如果在复杂模式下调用
         """
-        if not self.is_atom():
-            raise AttributeError("复杂Workable没有直接内容类型，请使用frames或本地Workable")
-        return self.content.content_type
+        raise AttributeError("复杂Workable没有直接内容类型，请使用frames或本地Workable")
     
     @content_type.setter
     def content_type(self, value: str) -> None:
-        """
-        设置内容类型 (仅简单模式)
-        
-        Args:
-            value: 新的内容类型
-            
-        Raises:
-            AttributeError: 如果在复杂模式下调用
-        """
-        if not self.is_atom():
-            raise AttributeError("复杂Workable没有直接内容类型，请使用frames或本地Workable")
-        self.content.content_type = value
+        raise AttributeError("复杂Workable没有直接内容类型，请使用frames或本地Workable")
     
     def update_content(self, content_str: str) -> None:
         """
         更新内容 (仅简单模式)
         
-        Args:
-            content_str: 新的内容字符串
-            
         Raises:
             AttributeError: 如果在复杂模式下调用
         """
-        if not self.is_atom():
-            raise AttributeError("复杂Workable没有直接内容，请使用frames或本地Workable")
-        self.content.content = content_str
-        self.logger.debug(f"更新Workable内容: {self.uuid}")
+        raise AttributeError("复杂Workable没有直接内容，请使用frames或本地Workable")
     
-    # 复杂模式方法 - 子Workable管理
+    # 复杂模式方法 (由ComplexWorkable实现)
     
     def add_child(self, child: 'Workable') -> None:
         """
         添加子Workable (仅复杂模式)
         
-        Args:
-            child: 要添加的子Workable
-            
         Raises:
             AttributeError: 如果在简单模式下调用
         """
-        if self.is_atom():
-            raise AttributeError("简单Workable不能添加子Workable，请先调用make_complex()")
-        
-        if not isinstance(child, Workable):
-            raise WorkableError(f"无效的Workable对象: {child}")
-        
-        # 缓存引用 (向后兼容)
-        if child.uuid in self._child_references:
-            self.logger.warning(f"覆盖已存在的子Workable引用: {child.uuid}")
-        self._child_references[child.uuid] = child
-        
-        # 添加索引
-        self.content.add_frame(
-            name=child.name,
-            logic_description=child.logic_description,
-            frame_type="child",
-            uuid=child.uuid,
-            is_local=False
-        )
+        raise AttributeError("简单Workable不能添加子Workable，请先调用make_complex()")
+    
+    def add_children(self, children: Iterable['Workable']) -> None:
+        """
+        批量添加子Workable (仅复杂模式)
         
-        self.logger.debug(f"添加子Workable: {child.uuid}")
+        Raises:
+            AttributeError: 如果在简单模式下调用
+        """
+        raise AttributeError("简单Workable不能添加子Workable，请先调用make_complex()")
     
     def remove_child(self, uuid: str) -> bool:
         """
         删除子Workable (仅复杂模式)
         
-        Args:
-            uuid: 要删除的子Workable的UUID
-            
-        Returns:
-            是否成功删除
-            
         Raises:
             AttributeError: 如果在简单模式下调用
         """
-        if self.is_atom():
-            raise AttributeError("简单Workable不能删除子Workable")
-        
-        # 从缓存中删除
-        if uuid in self._child_references:
-            del self._child_references[uuid]
-        else:
-            self.logger.warning(f"尝试删除不存在的子Workable引用: {uuid}")
-        
-        # 删除所有相关Frame
-        frames = self.content.get_frame_by_uuid(uuid, frame_type="child")
-        for frame in frames:
-            self.content.remove_frame(frame.seq)
-        
-        self.logger.debug(f"删除子Workable: {uuid}")
-        return bool(frames)
+        raise AttributeError("简单Workable不能删除子Workable")
     
     def get_children(self) -> List['Workable']:
         """
         获取所有子Workable (仅复杂模式)
         
-        Returns:
-            子Workable列表
-            
         Raises:
             AttributeError: 如果在简单模式下调用
         """
-        if self.is_atom():
-            raise AttributeError("简单Workable没有子Workable")
-        
-        result = []
-        child_frames = self.content.get_frames_by_type("child")
-        
-        for frame in child_frames:
-            uuid = frame.get_reference_uuid()
-            
-            # 首先检查缓存
-            if uuid in self._child_references:
-                result.append(self._child_references[uuid])
-                continue
-                
-            # 然后尝试从管理器获取
-            if self.manager:
-                child = self.manager.get_workable(uuid)
-                if child:
-                    # 更新缓存
-                    self._child_references[uuid] = child
-                    result.append(child)
+        raise AttributeError("简单Workable没有子Workable")
+    
+    def get_all_children(self) -> Mapping[str, 'Workable']:
+        """
+        获取所有子Workable的只读映射 (仅复杂模式)
         
-        return result
+        Raises:
+            AttributeError: 如果在简单模式下调用
+        """
+        raise AttributeError("简单Workable没有子Workable")
     
     @property
-    def child_workables(self) -> Dict[str, 'Workable']:
+    def child_workables(self) -> Mapping[str, 'Workable']:
         """
-        获取所有子Workable的字典 (向后兼容属性)
-        
-        Returns:
-            子Workable字典
+        获取所有子Workable的只读映射 (向后兼容属性)，简单模式下为空
         """
-        if self.is_atom():
-            return {}
-        
-        result = {}
-        for child in self.get_children():
-            result[child.uuid] = child
-        
-        return result
+        return {}
     
     @child_workables.setter
     def child_workables(self, value: Dict[str, 'Workable']) -> None:
-        """
-        设置子Workable字典 (向后兼容，仅更新缓存)
-        
-        Args:
-            value: 子Workable字典
-        """
-        if self.is_atom():
-            return
-            
-        self._child_references = value or {}
+        """简单模式下忽略 (向后兼容)"""
     
     # 本地Workable方法
     
@@ -451,14 +338,23 @@ class Workable:
         Args:
             local: 要添加的本地Workable
         """
-        if not local.is_atom():
+        if not local.is_atom_flag:
             raise WorkableError(f"本地Workable必须是简单类型: {local}")
         
+        self._add_local_unchecked(local)
+    
+    def _add_local_unchecked(self, local: 'Workable') -> None:
+        """
+        添加本地Workable，跳过类型检查 (供内部已验证的路径使用)
+        
+        Args:
+            local: 要添加的本地Workable
+        """
         # 标记为本地
         local.is_local = True
         
-        # 缓存引用 (向后兼容)
-        self._local_references[local.uuid] = local
+        # 记录本地Workable
+        self._locals[local.uuid] = local
         
         # 添加索引
         self.content.add_frame(
@@ -469,7 +365,33 @@ class Workable:
             is_local=True
         )
         
-        self.logger.debug(f"添加本地Workable: {local.uuid}")
+        logger.debug("添加本地Workable: %s", local.uuid)
+    
+    def add_locals(self, locals_: Iterable['Workable']) -> None:
+        """
+        批量添加本地Workable，所有Frame一次性写入Content
+        
+        Args:
+            locals_: 要添加的本地Workable集合
+            
+        Raises:
+            WorkableError: 如果存在复杂类型的Workable (此时不会添加任何本地Workable)
+            ContentError: 如果存在名称或描述为空的Workable (此时不会添加任何本地Workable)
+        """
+        locals_ = list(locals_)
+        for local in locals_:
+            if not local.is_atom_flag:
+                raise WorkableError(f"本地Workable必须是简单类型: {local}")
+        
+        # 先写入Frame (整体校验)，成功后再修改本地表和标记
+        self.content.add_frames(
+            [(local.name, local.logic_description, "local", local.uuid) for local in locals_]
+        )
+        for local in locals_:
+            local.is_local = True
+        self._locals.update((local.uuid, local) for local in locals_)
+        
+        logger.debug("批量添加本地Workable: %s 个", len(locals_))
     
     def remove_local(self, uuid: str) -> bool:
         """
@@ -481,18 +403,16 @@ class Workable:
         Returns:
             是否成功删除
         """
-        # 从缓存中删除
-        if uuid in self._local_references:
-            del self._local_references[uuid]
+        # 从本地Workable表中删除
+        if uuid in self._locals:
+            del self._locals[uuid]
         else:
-            self.logger.warning(f"尝试删除不存在的本地Workable引用: {uuid}")
+            logger.warning("尝试删除不存在的本地Workable引用: %s", uuid)
         
         # 删除所有相关Frame
-        frames = self.content.get_frame_by_uuid(uuid, frame_type="local")
-        for frame in frames:
-            self.content.remove_frame(frame.seq)
+        frames = self.content.remove_frames_by_uuid(uuid, frame_type="local")
         
-        self.logger.debug(f"删除本地Workable: {uuid}")
+        logger.debug("删除本地Workable: %s", uuid)
         return bool(frames)
     
     def get_locals(self) -> List['Workable']:
@@ -502,44 +422,44 @@ class Workable:
         Returns:
             本地Workable列表
         """
-        result = []
-        local_frames = self.content.get_frames_by_type("local")
+        return list(self.get_all_locals().values())
+    
+    def get_all_locals(self) -> Mapping[str, 'Workable']:
+        """
+        获取所有本地Workable的只读映射，不复制字典
         
-        for frame in local_frames:
-            uuid = frame.get_reference_uuid()
-            
-            # 首先检查缓存
-            if uuid in self._local_references:
-                result.append(self._local_references[uuid])
-                continue
-                
-            # 这里不从管理器获取，因为本地Workable应该始终在缓存中
-            
-        return result
+        Returns:
+            UUID到本地Workable的只读映射
+        """
+        # 以本地Frame为准并按序列号排序，Frame被移除或移动后结果同步
+        content = self.content
+        frames_by_seq = content._frames_by_seq
+        local_table = self._locals
+        local_uuids = (frames_by_seq[seq].exref
+                       for seq in sorted(content._frames_by_type.get("local", ())))
+        return types.MappingProxyType(
+            {uuid: local_table[uuid] for uuid in local_uuids if uuid in local_table}
+        )
     
     @property
-    def local_workables(self) -> Dict[str, 'Workable']:
+    def local_workables(self) -> Mapping[str, 'Workable']:
         """
-        获取所有本地Workable的字典 (向后兼容属性)
+        获取所有本地Workable的只读映射 (向后兼容属性)
         
         Returns:
-            本地Workable字典
+            本地Workable映射
         """
-        result = {}
-        for local in self.get_locals():
-            result[local.uuid] = local
-        
-        return result
+        return self.get_all_locals()
     
     @local_workables.setter
     def local_workables(self, value: Dict[str, 'Workable']) -> None:
         """
-        设置本地Workable字典 (向后兼容，仅更新缓存)
+        设置本地Workable字典 (向后兼容，仅替换本地Workable表)
         
         Args:
             value: 本地Workable字典
         """
-        self._local_references = value or {}
+        self._locals = value or {}
     
     # 序列化与反序列化
         
@@ -557,10 +477,10 @@ class Workable:
             "uuid": self.uuid,
             "name": self.name,
             "logic_description": self.logic_description,
-            "is_atom": self.is_atom(),
+            "is_atom": self.is_atom_flag,
         }
         
-        if self.is_atom() and include_content:
+        if self.is_atom_flag and include_content:
             result["content"] = self.content.content
             result["content_type"] = self.content.content_type
         
@@ -569,8 +489,316 @@ class Workable:
         return result
     
     def __repr__(self) -> str:
-        type_str = "SimpleWorkable" if self.is_atom() else "ComplexWorkable"
-        return f"<{type_str} uuid={self.uuid[:6]} name={self.name}>"
+        return f"<{type(self).__name__} uuid={self._uuid_short} name={self.name}>"
+
+
+class SimpleWorkable(Workable):
+    """
+    简单(原子)模式的Workable，直接持有内容
+    """
+    
+    __slots__ = ()
+    
+    is_atom_flag = True  # 模式标识由类决定，不占用实例存储
+    
+    def make_complex(self) -> 'Workable':
+        """
+        将简单Workable转换为复杂Workable
+        
+        Returns:
+            转换后的Workable (self)
+        """
+        # 将原始内容保存为本地Workable
+        original_content = self.content.content
+        original_content_type = self.content.content_type
+        
+        if original_content:
+            # 创建本地Workable保存原内容
+            local_workable = Workable(
+                name=f"{self.name}_content",
+                logic_description=self.logic_description,
+                is_atom=True,
+                content_str=original_content,
+                content_type=original_content_type,
+                manager=self.manager
+            )
+            
+            # 标记为转换后的本地内容
+            local_workable.is_converted_content = True
+            self._converted_content_uuid = local_workable.uuid
+            
+            # 原地清空直接内容，保留已有的本地Frame
+            self.content.content = ""
+            self.content.content_type = "text"
+            
+            # 添加为本地引用 - 使用新的索引机制 (新建的Workable必为简单类型)
+            self._add_local_unchecked(local_workable)
+        
+        # 状态转换
+        self.__class__ = ComplexWorkable
+        
+        # 初始化子引用字典
+        self._children = {}
+        
+        if self.manager is not None:
+            self.manager._update_type_index(self)
+        
+        logger.info("Workable %s 已从简单类型转换为复杂类型", self.uuid)
+        
+        return self
+    
+    @property
+    def content_str(self) -> str:
+        """
+        获取内容字符串
+        
+        Returns:
+            内容字符串
+        """
+        return self.content.content
+    
+    @content_str.setter
+    def content_str(self, value: str) -> None:
+        """
+        设置内容字符串
+        
+        Args:
+            value: 新的内容字符串
+        """
+        self.content.content = value
+    
+    @property
+    def content_type(self) -> str:
+        """
+        获取内容类型
+        
+        Returns:
+            内容类型
+        """
+        return self.content.content_type
+    
+    @content_type.setter
+    def content_type(self, value: str) -> None:
+        """
+        设置内容类型
+        
+        Args:
+            value: 新的内容类型
+        """
+        self.content.content_type = _intern_str(value)
+    
+    def update_content(self, content_str: str) -> None:
+        """
+        更新内容
+        
+        Args:
+            content_str: 新的内容字符串
+        """
+        self.content.content = content_str
+        logger.debug("更新Workable内容: %s", self.uuid)
+
+
+class ComplexWorkable(Workable):
+    """
+    复杂(复合)模式的Workable，通过Frame索引管理子Workable和本地Workable
+    """
+    
+    __slots__ = ()
+    
+    is_atom_flag = False  # 模式标识由类决定，不占用实例存储
+    
+    def make_simple(self) -> 'Workable':
+        """
+        将复杂Workable转换为简单Workable
+        
+        Returns:
+            转换后的Workable (self)
+            
+        Raises:
+            ConversionError: 如果转换失败
+        """
+        # 检查是否可以转换: 必须没有子Workable
+        child_frames = self.content.get_frames_by_type("child")
+        if child_frames and len(child_frames) > 0:
+            raise ConversionError(f"无法转换含有子Workable的复杂Workable: {self.uuid}")
+        
+        # 检查是否有原始内容的本地Workable
+        content_workable = None
+        if self._converted_content_uuid is not None:
+            content_workable = self._locals.get(self._converted_content_uuid)
+                
+        if not content_workable:
+            # 需要有且仅有一个本地Workable作为内容
+            local_count = len(self.content._frames_by_type.get("local", ()))
+            if local_count != 1:
+                raise ConversionError(
+                    f"复杂Workable {self.uuid} 包含 {local_count} 个本地Workable，"
+                    f"无法转换为简单Workable（需要恰好1个）"
+                )
+            
+            # 获取唯一的本地Workable
+            locals_view = self.get_all_locals()
+            if not locals_view:
+                local_uuid = self.content.get_frames_by_type("local")[0].exref
+                raise ConversionError(f"找不到本地Workable: {local_uuid}")
+            content_workable = next(iter(locals_view.values()))
+        
+        # 从本地Workable提取内容
+        self.content = Content(
+            content_type=content_workable.content.content_type,
+            content=content_workable.content.content
+        )
+        
+        # 状态转换
+        self.__class__ = SimpleWorkable
+        self._locals = {}  # 清空本地引用
+        self._children = None  # 清空子引用
+        self._converted_content_uuid = None
+        
+        if self.manager is not None:
+            self.manager._update_type_index(self)
+        
+        logger.info("Workable %s 已从复杂类型转换为简单类型", self.uuid)
+        
+        return self
+    
+    def add_child(self, child: 'Workable') -> None:
+        """
+        添加子Workable
+        
+        Args:
+            child: 要添加的子Workable
+        """
+        if not isinstance(child, Workable):
+            raise WorkableError(f"无效的Workable对象: {child}")
+        
+        # 记录子Workable (写入后表的大小不变即为覆盖，只需一次哈希查找)
+        children = self._children
+        count = len(children)
+        children[child.uuid] = child
+        if len(children) == count:
+            logger.warning("覆盖已存在的子Workable引用: %s", child.uuid)
+        
+        # 添加索引
+        self.content.add_frame(
+            name=child.name,
+            logic_description=child.logic_description,
+            frame_type="child",
+            uuid=child.uuid,
+            is_local=False
+        )
+        
+        logger.debug("添加子Workable: %s", child.uuid)
+    
+    def add_children(self, children: Iterable['Workable']) -> None:
+        """
+        批量添加子Workable，所有Frame一次性写入Content
+        
+        Args:
+            children: 要添加的子Workable集合
+            
+        Raises:
+            WorkableError: 如果存在无效的Workable对象 (此时不会添加任何子Workable)
+            ContentError: 如果存在名称或描述为空的Workable (此时不会添加任何子Workable)
+        """
+        children = list(children)
+        for child in children:
+            if not isinstance(child, Workable):
+                raise WorkableError(f"无效的Workable对象: {child}")
+        
+        # 先写入Frame (整体校验)，成功后再修改子Workable表
+        self.content.add_frames(
+            [(child.name, child.logic_description, "child", child.uuid) for child in children]
+        )
+        self._children.update((child.uuid, child) for child in children)
+        
+        logger.debug("批量添加子Workable: %s 个", len(children))
+    
+    def remove_child(self, uuid: str) -> bool:
+        """
+        删除子Workable
+        
+        Args:
+            uuid: 要删除的子Workable的UUID
+            
+        Returns:
+            是否成功删除
+        """
+        # 从子Workable表中删除
+        if uuid in self._children:
+            del self._children[uuid]
+        else:
+            logger.warning("尝试删除不存在的子Workable引用: %s", uuid)
+        
+        # 删除所有相关Frame
+        frames = self.content.remove_frames_by_uuid(uuid, frame_type="child")
+        
+        logger.debug("删除子Workable: %s", uuid)
+        return bool(frames)
+    
+    def get_children(self) -> List['Workable']:
+        """
+        获取所有子Workable
+        
+        Returns:
+            子Workable列表
+        """
+        return list(self._resolve_children().values())
+    
+    def get_all_children(self) -> Mapping[str, 'Workable']:
+        """
+        获取所有子Workable的只读映射
+        
+        Returns:
+            UUID到子Workable的只读映射
+        """
+        return types.MappingProxyType(self._resolve_children())
+    
+    def _resolve_children(self) -> Dict[str, 'Workable']:
+        """
+        以子Frame为准，按序列号顺序收集子Workable
+        
+        尚未记录在_children中的子Workable从管理器补全；Frame已被移除的子Workable不会返回。
+        
+        Returns:
+            UUID到子Workable的字典
+        """
+        # 循环内只使用局部变量
+        content = self.content
+        frames_by_seq = content._frames_by_seq
+        children = self._children
+        manager = self.manager
+        result = {}
+        for seq in sorted(content._frames_by_type.get("child", ())):
+            uuid = frames_by_seq[seq].exref
+            child = children.get(uuid)
+            if child is None and manager is not None:
+                child = manager.get_workable(uuid)
+                if child is not None:
+                    children[uuid] = child
+            if child is not None:
+                result[uuid] = child
+        return result
+    
+    @property
+    def child_workables(self) -> Mapping[str, 'Workable']:
+        """
+        获取所有子Workable的只读映射 (向后兼容属性)
+        
+        Returns:
+            子Workable映射
+        """
+        return self.get_all_children()
+    
+    @child_workables.setter
+    def child_workables(self, value: Dict[str, 'Workable']) -> None:
+        """
+        设置子Workable字典 (向后兼容，仅替换子Workable表)
+        
+        Args:
+            value: 子Workable字典
+        """
+        self._children = value or {}
 
 
 # 兼容性转换函数
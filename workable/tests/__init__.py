@@ -1,3 +1,35 @@
 """
 Workable测试模块
-""" 
\ No newline at end of file
+"""
+
+import logging
+import os
+
+# 包内使用的顶层记录器名称 (workable.core.message等模块记录器是"workable"的子记录器)
+_PACKAGE_LOGGERS = ("workable", "content", "relation", "message", "workable_manager",
+                    "conversion", "workable_visualizer")
+
+_logging_configured = False
+
+
+def configure_test_logging(**basic_config) -> None:
+    """
+    配置测试日志: 默认不输出，设置WORKABLE_TEST_DEBUG时打开DEBUG日志
+
+    默认为包内所有记录器添加NullHandler，避免警告经由logging的最后兜底处理器输出到stderr。
+    多次调用只有第一次生效。
+
+    Args:
+        **basic_config: 打开DEBUG日志时传给logging.basicConfig的额外参数
+    """
+    global _logging_configured
+    if _logging_configured:
+        return
+    _logging_configured = True
+
+    if os.environ.get("WORKABLE_TEST_DEBUG"):
+        logging.basicConfig(level=logging.DEBUG, **basic_config)
+        return
+
+    for name in _PACKAGE_LOGGERS:
+        logging.getLogger(name).addHandler(logging.NullHandler())
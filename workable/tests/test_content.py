@@ -3,95 +3,93 @@
 """
 
 import unittest
-import logging
-from unittest.mock import patch, MagicMock
 
-from workable.core.models import WorkableFrame
 from workable.core.content import Content
 from workable.core.exceptions import ContentError
+from workable.tests import configure_test_logging
 
-# 配置测试日志
-logging.basicConfig(level=logging.DEBUG)
+configure_test_logging()
 
 class MockSimpleWorkable:
-    """模拟SimpleWorkable类"""
+    """模拟SimpleWorkable类 (仅保存Content用到的属性)"""
+    
+    __slots__ = ('uuid', 'name', 'logic_description', 'content_str')
+    
+    # 名称到UUID的缓存，同名实例不再重复拼接字符串
+    _UUID_CACHE = {}
     
     def __init__(self, name, logic_description, content_str=""):
-        self.uuid = f"mock-{name.lower().replace(' ', '-')}"
+        try:
+            self.uuid = self._UUID_CACHE[name]
+        except KeyError:
+            self.uuid = self._UUID_CACHE[name] = f"mock-{name.lower().replace(' ', '-')}"
         self.name = name
         self.logic_description = logic_description
         self.content_str = content_str
 
 
-class TestContent(unittest.TestCase):
-    """测试Content类"""
+class TestContentReadOnly(unittest.TestCase):
+    """测试Content的只读方法 (所有测试共享同一个预先填充的Content)"""
+    
+    @classmethod
+    def setUpClass(cls):
+        """创建并填充共享的Content: 一个引用Frame和一个本地Workable"""
+        cls.workable1 = MockSimpleWorkable(name="Workable 1", logic_description="Test workable 1")
+        cls.workable2 = MockSimpleWorkable(name="Workable 2", logic_description="Test workable 2")
+        
+        cls.content = Content()
+        cls.frame_seq = cls.content.add_frame(
+            name="Frame 1",
+            logic_description="Test frame 1",
+            frame_type="reference",
+            uuid="ext-uuid-1"
+        )
+        cls.local_seq = cls.content.add_local_workable(cls.workable1)
     
     def setUp(self):
-        """每个测试前执行"""
-        self.content = Content()
-        
-        # 添加一些测试Frames
-        self.frame1 = WorkableFrame(name="Frame 1", logic_description="Test frame 1", exref="ext-uuid-1")
-        self.frame2 = WorkableFrame(name="Frame 2", logic_description="Test frame 2", lnref="local-uuid-1")
-        
-        # 添加一些测试Workables
-        self.workable1 = MockSimpleWorkable(name="Workable 1", logic_description="Test workable 1")
-        self.workable2 = MockSimpleWorkable(name="Workable 2", logic_description="Test workable 2")
+        """每个测试前确认共享的Content没有被其他测试修改"""
+        self.assertEqual(self.content.frame_count, 2)
+        self.assertEqual(self.content.workable_count, 1)
     
     def test_frames_property(self):
         """测试frames属性"""
-        # 添加Frame
-        self.content.add_frame(self.frame1)
-        
-        # 获取frames副本
+        # 获取frames只读元组
         frames = self.content.frames
         
-        # 验证是否为副本
-        self.assertEqual(len(frames), 1)
+        # 验证顺序和内容
+        self.assertEqual(len(frames), 2)
         self.assertEqual(frames[0].name, "Frame 1")
+        self.assertEqual(frames[1].name, "Workable 1")
         
-        # 修改副本不应影响原始数据
-        frames.append(self.frame2)
-        self.assertEqual(len(self.content.frames), 1)
+        # 返回值不可修改
+        self.assertIsInstance(frames, tuple)
     
     def test_workables_property(self):
         """测试workables属性"""
-        # 添加本地Workable
-        self.content._local_workables[self.workable1.uuid] = self.workable1
-        
-        # 获取workables副本
+        # 获取workables只读映射
         workables = self.content.workables
         
-        # 验证是否为副本
+        # 验证内容
         self.assertEqual(len(workables), 1)
         self.assertEqual(list(workables.keys())[0], self.workable1.uuid)
         
-        # 修改副本不应影响原始数据
-        workables[self.workable2.uuid] = self.workable2
-        self.assertEqual(len(self.content.workables), 1)
+        # 只读映射不允许修改
+        with self.assertRaises(TypeError):
+            workables[self.workable2.uuid] = self.workable2
+        self.assertEqual(self.content.workable_count, 1)
     
     def test_get_frame(self):
         """测试get_frame方法"""
-        # 添加Frame
-        self.content.add_frame(self.frame1)
-        self.content.add_frame(self.frame2)
-        
-        # 获取有效索引
-        frame = self.content.get_frame(1)
-        self.assertEqual(frame.name, "Frame 2")
-        
-        # 获取无效索引
-        frame = self.content.get_frame(2)
-        self.assertIsNone(frame)
+        # 获取有效序列号
+        frame = self.content.get_frame(self.local_seq)
+        self.assertEqual(frame.name, "Workable 1")
         
-        frame = self.content.get_frame(-1)
-        self.assertIsNone(frame)
+        # 获取无效序列号
+        self.assertIsNone(self.content.get_frame(self.local_seq + 1))
+        self.assertIsNone(self.content.get_frame(-1))
     
     def test_get_workable(self):
         """测试get_workable方法"""
-        # 添加本地Workable
-        self.content._local_workables[self.workable1.uuid] = self.workable1
-        
         # 获取有效UUID
         workable = self.content.get_workable(self.workable1.uuid)
         self.assertEqual(workable.name, "Workable 1")
@@ -99,25 +97,54 @@ class TestContent(unittest.TestCase):
         # 获取无效UUID
         workable = self.content.get_workable("invalid-uuid")
         self.assertIsNone(workable)
+
+
+class TestContent(unittest.TestCase):
+    """测试Content类"""
+    
+    @classmethod
+    def setUpClass(cls):
+        """所有测试共享的只读Workable，只创建一次"""
+        cls.workable1 = MockSimpleWorkable(name="Workable 1", logic_description="Test workable 1")
+        cls.workable2 = MockSimpleWorkable(name="Workable 2", logic_description="Test workable 2")
+    
+    def setUp(self):
+        """每个测试前执行，只创建可变的Content"""
+        self.content = Content()
+    
+    @staticmethod
+    def _make_workable(name="Workable 1", logic_description="Test workable 1"):
+        """为会修改Workable属性的测试创建独立实例"""
+        return MockSimpleWorkable(name=name, logic_description=logic_description)
+    
+    def _add_frames(self):
+        """添加两个引用Frame，返回它们的序列号"""
+        seq1 = self.content.add_frame(name="Frame 1", logic_description="Test frame 1", uuid="ext-uuid-1")
+        seq2 = self.content.add_frame(name="Frame 2", logic_description="Test frame 2", uuid="ext-uuid-2")
+        return seq1, seq2
     
     def test_add_frame(self):
         """测试add_frame方法"""
-        # 添加有效Frame
-        index = self.content.add_frame(self.frame1)
-        self.assertEqual(index, 0)
-        self.assertEqual(len(self.content.frames), 1)
+        # 添加有效Frame (序列号从1开始)
+        seq = self.content.add_frame(name="Frame 1", logic_description="Test frame 1", uuid="ext-uuid-1")
+        self.assertEqual(seq, 1)
+        self.assertEqual(self.content.frame_count, 1)
+        self.assertEqual(self.content.get_frame(seq).name, "Frame 1")
         
         # 添加无效Frame
         with self.assertRaises(ContentError):
-            self.content.add_frame("not a frame")
+            self.content.add_frame(name="", logic_description="No name", uuid="ext-uuid-2")
+        with self.assertRaises(ContentError):
+            self.content.add_frame(name="No UUID", logic_description="Missing reference")
+        self.assertEqual(self.content.frame_count, 1)
     
     def test_add_local_workable(self):
         """测试add_local_workable方法"""
         # 添加有效Workable
-        index = self.content.add_local_workable(self.workable1)
-        self.assertEqual(index, 0)
-        self.assertEqual(len(self.content.workables), 1)
-        self.assertEqual(len(self.content.frames), 1)
+        seq = self.content.add_local_workable(self.workable1)
+        self.assertEqual(seq, 1)
+        self.assertEqual(self.content.workable_count, 1)
+        self.assertEqual(self.content.frame_count, 1)
         
         # 添加同一个Workable应该失败
         with self.assertRaises(ContentError):
@@ -132,8 +159,9 @@ class TestContent(unittest.TestCase):
     
     def test_update_workable(self):
         """测试update_workable方法"""
-        # 添加Workable
-        self.content.add_local_workable(self.workable1)
+        # 添加Workable (该测试会修改Workable，使用独立实例)
+        workable = self._make_workable()
+        self.content.add_local_workable(workable)
         
         # 获取Frame
         frame = self.content.frames[0]
@@ -141,14 +169,14 @@ class TestContent(unittest.TestCase):
         
         # 更新Workable
         result = self.content.update_workable(
-            self.workable1.uuid,
+            workable.uuid,
             name="Updated Name",
             logic_description="Updated description"
         )
         
         self.assertTrue(result)
-        self.assertEqual(self.workable1.name, "Updated Name")
-        self.assertEqual(self.workable1.logic_description, "Updated description")
+        self.assertEqual(workable.name, "Updated Name")
+        self.assertEqual(workable.logic_description, "Updated description")
         
         # 验证Frame也被更新
         frame = self.content.frames[0]
@@ -162,15 +190,14 @@ class TestContent(unittest.TestCase):
     def test_remove_frame(self):
         """测试remove_frame方法"""
         # 添加Frames
-        self.content.add_frame(self.frame1)
-        self.content.add_frame(self.frame2)
+        seq1, seq2 = self._add_frames()
         
-        # 移除有效索引
-        frame = self.content.remove_frame(0)
+        # 移除有效序列号
+        frame = self.content.remove_frame(seq1)
         self.assertEqual(frame.name, "Frame 1")
-        self.assertEqual(len(self.content.frames), 1)
+        self.assertEqual(self.content.frame_count, 1)
         
-        # 移除无效索引
+        # 移除无效序列号
         with self.assertRaises(ContentError):
             self.content.remove_frame(10)
     
@@ -183,8 +210,8 @@ class TestContent(unittest.TestCase):
         # 移除有效UUID
         result = self.content.remove_local_workable(self.workable1.uuid)
         self.assertTrue(result)
-        self.assertEqual(len(self.content.workables), 1)
-        self.assertEqual(len(self.content.frames), 1)
+        self.assertEqual(self.content.workable_count, 1)
+        self.assertEqual(self.content.frame_count, 1)
         
         # 确认正确的Frame被移除
         frame = self.content.frames[0]
@@ -197,11 +224,10 @@ class TestContent(unittest.TestCase):
     def test_move_frame(self):
         """测试move_frame方法"""
         # 添加Frames
-        self.content.add_frame(self.frame1)
-        self.content.add_frame(self.frame2)
+        seq1, seq2 = self._add_frames()
         
         # 移动Frame
-        result = self.content.move_frame(0, 1)
+        result = self.content.move_frame(seq1, seq2)
         self.assertTrue(result)
         
         # 验证移动结果
@@ -209,9 +235,11 @@ class TestContent(unittest.TestCase):
         self.assertEqual(frames[0].name, "Frame 2")
         self.assertEqual(frames[1].name, "Frame 1")
         
-        # 测试无效索引
+        # 测试无效序列号
+        with self.assertRaises(ContentError):
+            self.content.move_frame(10, seq1)
         with self.assertRaises(ContentError):
-            self.content.move_frame(0, 10)
+            self.content.move_frame(seq1, -1)
     
     def test_validate(self):
         """测试validate方法"""
@@ -226,21 +254,20 @@ class TestContent(unittest.TestCase):
         is_valid, orphans, ghosts = self.content.validate()
         self.assertTrue(is_valid)
         
-        # 创建孤立Frame
-        orphan_frame = WorkableFrame(
+        # 创建孤立Frame (本地引用没有对应的Workable)
+        orphan_seq = self.content.add_frame(
             name="Orphan Frame",
             logic_description="Orphan frame",
-            lnref="non-existent-uuid"
+            uuid="non-existent-uuid",
+            is_local=True
         )
-        self.content.add_frame(orphan_frame)
         
         is_valid, orphans, ghosts = self.content.validate()
         self.assertFalse(is_valid)
-        self.assertEqual(len(orphans), 1)
-        self.assertEqual(orphans[0], 1)  # 第二个Frame (索引1)
+        self.assertEqual(orphans, [orphan_seq])
         
         # 创建幽灵Workable（没有对应Frame引用）
-        self.content._local_workables["ghost-uuid"] = MockSimpleWorkable(
+        self.content._local_workables_cache["ghost-uuid"] = MockSimpleWorkable(
             name="Ghost Workable",
             logic_description="Ghost workable"
         )
@@ -256,16 +283,16 @@ class TestContent(unittest.TestCase):
         self.content.add_local_workable(self.workable1)
         
         # 添加孤立Frame
-        orphan_frame = WorkableFrame(
+        self.content.add_frame(
             name="Orphan Frame",
             logic_description="Orphan frame",
-            lnref="non-existent-uuid"
+            uuid="non-existent-uuid",
+            is_local=True
         )
-        self.content.add_frame(orphan_frame)
         
         # 添加幽灵Workable
         ghost = MockSimpleWorkable(name="Ghost", logic_description="Ghost workable")
-        self.content._local_workables[ghost.uuid] = ghost
+        self.content._local_workables_cache[ghost.uuid] = ghost
         
         # 验证初始状态
         is_valid, orphans, ghosts = self.content.validate()
@@ -284,7 +311,7 @@ class TestContent(unittest.TestCase):
         self.assertEqual(ghosts, [])
         
         # 验证数据正确性
-        self.assertEqual(len(self.content.frames), 2)  # 1个有效 + 1个为幽灵Workable创建的
+        self.assertEqual(self.content.frame_count, 2)  # 1个有效 + 1个为幽灵Workable创建的
 
 
 if __name__ == "__main__":
@@ -3,7 +3,6 @@
 """
 
 import unittest
-import logging
 
 from workable.core.exceptions import (
     WorkableError, 
@@ -13,83 +12,39 @@ from workable.core.exceptions import (
     ManagerError,
     ConversionError
 )
+from workable.tests import configure_test_logging
 
-# 配置测试日志
-logging.basicConfig(level=logging.DEBUG)
+configure_test_logging()
 
 class TestExceptions(unittest.TestCase):
     """测试Workable系统中的异常类"""
     
-    def test_workable_error(self):
-        """测试WorkableError异常"""
-        # 创建异常
-        error = WorkableError("Test workable error")
-        
-        # 验证异常消息
-        self.assertEqual(str(error), "Test workable error")
-        
-        # 验证异常继承关系
-        self.assertTrue(isinstance(error, Exception))
-    
-    def test_message_error(self):
-        """测试MessageError异常"""
-        # 创建异常
-        error = MessageError("Test message error")
-        
-        # 验证异常消息
-        self.assertEqual(str(error), "Test message error")
-        
-        # 验证异常继承关系
-        self.assertTrue(isinstance(error, WorkableError))
-        self.assertTrue(isinstance(error, Exception))
+    # 各异常类及其测试消息
+    _ERROR_CLASSES = [
+        (WorkableError, "Test workable error"),
+        (MessageError, "Test message error"),
+        (RelationError, "Test relation error"),
+        (ContentError, "Test content error"),
+        (ManagerError, "Test manager error"),
+        (ConversionError, "Test conversion error"),
+    ]
     
-    def test_relation_error(self):
-        """测试RelationError异常"""
-        # 创建异常
-        error = RelationError("Test relation error")
-        
-        # 验证异常消息
-        self.assertEqual(str(error), "Test relation error")
-        
-        # 验证异常继承关系
-        self.assertTrue(isinstance(error, WorkableError))
-        self.assertTrue(isinstance(error, Exception))
+    def test_error_hierarchy(self):
+        """测试各异常类的消息和继承关系"""
+        for error_class, message in self._ERROR_CLASSES:
+            with self.subTest(error_class=error_class.__name__):
+                # 创建异常
+                error = error_class(message)
+                
+                # 验证异常消息
+                self.assertEqual(str(error), message)
+                
+                # 验证异常继承关系 (WorkableError本身继承自Exception)
+                self.assertIsInstance(error, WorkableError)
     
-    def test_content_error(self):
-        """测试ContentError异常"""
-        # 创建异常
-        error = ContentError("Test content error")
-        
-        # 验证异常消息
-        self.assertEqual(str(error), "Test content error")
-        
-        # 验证异常继承关系
-        self.assertTrue(isinstance(error, WorkableError))
-        self.assertTrue(isinstance(error, Exception))
-    
-    def test_manager_error(self):
-        """测试ManagerError异常"""
-        # 创建异常
-        error = ManagerError("Test manager error")
-        
-        # 验证异常消息
-        self.assertEqual(str(error), "Test manager error")
-        
-        # 验证异常继承关系
-        self.assertTrue(isinstance(error, WorkableError))
-        self.assertTrue(isinstance(error, Exception))
-    
-    def test_conversion_error(self):
-        """测试ConversionError异常"""
-        # 创建异常
-        error = ConversionError("Test conversion error")
-        
-        # 验证异常消息
-        self.assertEqual(str(error), "Test conversion error")
-        
-        # 验证异常继承关系
-        self.assertTrue(isinstance(error, WorkableError))
-        self.assertTrue(isinstance(error, Exception))
+    def test_base_error(self):
+        """测试异常基类继承自Exception"""
+        self.assertTrue(issubclass(WorkableError, Exception))
     
     def test_error_with_details(self):
         """测试带有详细信息的异常"""
@@ -5,7 +5,7 @@
 import unittest
 import logging
 import os
-from unittest.mock import patch, MagicMock, mock_open
+import tempfile
 
 from workable.utils.logging import configure_logging
 
@@ -15,57 +15,75 @@ logging.disable(logging.CRITICAL)
 class TestLogging(unittest.TestCase):
     """测试日志配置工具"""
     
+    @classmethod
+    def setUpClass(cls):
+        """备份根日志配置，整个测试类只做一次"""
+        cls._orig_handlers = tuple(logging.root.handlers)
+        cls._orig_level = logging.root.level
+        
+        # 测试中用到的记录器只查找一次
+        cls._test_logger = logging.getLogger("test")
+        cls._workable_logger = logging.getLogger("workable")
+        
+        # 日志文件写入整个测试类共用的临时目录，每个测试使用自己的文件名
+        cls._tmpdir = tempfile.TemporaryDirectory()
+    
+    @classmethod
+    def tearDownClass(cls):
+        """所有测试结束后恢复根日志配置"""
+        logging.root.handlers[:] = cls._orig_handlers
+        logging.root.setLevel(cls._orig_level)
+        cls._tmpdir.cleanup()
+    
     def setUp(self):
         """每个测试前执行"""
-        # 备份并清除根日志配置
-        self.root_handlers = logging.root.handlers.copy()
-        self.root_level = logging.root.level
+        self.log_path = os.path.join(self._tmpdir.name, f"{self._testMethodName}.log")
+        self.addCleanup(self._close_handlers)
         
         # 清除根日志配置
         logging.root.handlers.clear()
-        
-        # 创建测试日志记录器
-        self.logger = logging.getLogger("test_logger")
-        self.logger.handlers.clear()
-        self.logger.propagate = True
     
-    def tearDown(self):
-        """每个测试后执行"""
-        # 恢复根日志配置
+    def _close_handlers(self):
+        """关闭测试中创建的处理程序，释放日志文件"""
+        for handler in logging.root.handlers + self._workable_logger.handlers:
+            handler.close()
+        self._workable_logger.handlers.clear()
         logging.root.handlers.clear()
-        for handler in self.root_handlers:
-            logging.root.addHandler(handler)
-        logging.root.setLevel(self.root_level)
-        
-        # 移除测试文件
-        if os.path.exists("test.log"):
-            os.remove("test.log")
     
-    def test_configure_default(self):
-        """测试默认配置"""
-        # 配置日志
-        configure_logging()
-        
-        # 验证根日志级别
-        self.assertEqual(logging.root.level, logging.INFO)
-        
-        # 验证处理程序
-        self.assertEqual(len(logging.root.handlers), 1)
-        self.assertIsInstance(logging.root.handlers[0], logging.StreamHandler)
-    
-    def test_configure_with_level(self):
-        """测试指定日志级别"""
-        # 配置日志
-        configure_logging(log_level=logging.DEBUG)
+    def test_configure_variants(self):
+        """测试默认配置、指定级别、指定格式以及多次配置"""
+        custom_format = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
         
-        # 验证根日志级别
-        self.assertEqual(logging.root.level, logging.DEBUG)
+        # 按顺序执行，后一次配置替换前一次的处理程序而不是叠加
+        for kwargs, expected_level in [
+            ({}, logging.INFO),
+            ({"log_level": logging.DEBUG}, logging.DEBUG),
+            ({"log_level": logging.ERROR}, logging.ERROR),
+            ({"log_format": custom_format}, logging.INFO),
+        ]:
+            with self.subTest(**kwargs):
+                configure_logging(**kwargs)
+                
+                # 验证根日志级别
+                self.assertEqual(logging.root.level, expected_level)
+                
+                # 验证处理程序
+                self.assertEqual(len(logging.root.handlers), 1)
+                self.assertIsInstance(logging.root.handlers[0], logging.StreamHandler)
+                
+                # 验证处理程序格式
+                if "log_format" in kwargs:
+                    self.assertEqual(logging.root.handlers[0].formatter._fmt, custom_format)
+        
+        # 每次配置的处理程序使用独立的格式化器，修改其中一个不会影响其他处理程序
+        formatter = logging.root.handlers[0].formatter
+        configure_logging(log_format=custom_format)
+        self.assertIsNot(logging.root.handlers[0].formatter, formatter)
     
-    @patch("builtins.open", new_callable=mock_open)
-    def test_configure_with_file(self, mock_file):
+    def test_configure_with_file(self):
         """测试指定日志文件"""
         # 配置日志
-        configure_logging(log_file="test.log")
+        configure_logging(log_file=self.log_path)
         
         # 验证根日志级别
         self.assertEqual(logging.root.level, logging.INFO)
@@ -80,6 +98,10 @@ class TestLogging(unittest.TestCase):
         # 验证控制台处理程序
         console_handlers = [h for h in logging.root.handlers if isinstance(h, logging.StreamHandler) and not isinstance(h, logging.FileHandler)]
         self.assertEqual(len(console_handlers), 1)
+        
+        # 修改文件处理程序的格式化器不影响控制台处理程序
+        file_handlers[0].formatter.datefmt = "%H:%M:%S"
+        self.assertIsNone(console_handlers[0].formatter.datefmt)
     
     def test_configure_without_console(self):
         """测试禁用控制台输出"""
@@ -97,11 +119,10 @@ class TestLogging(unittest.TestCase):
         console_handlers = [h for h in logging.root.handlers if isinstance(h, logging.StreamHandler) and not isinstance(h, logging.FileHandler)]
         self.assertEqual(len(console_handlers), 0)  # 没有控制台处理程序
     
-    @patch("builtins.open", new_callable=mock_open)
-    def test_configure_without_console_with_file(self, mock_file):
+    def test_configure_without_console_with_file(self):
         """测试禁用控制台输出但启用文件输出"""
         # 配置日志
-        configure_logging(log_file="test.log", console=False)
+        configure_logging(log_file=self.log_path, console=False)
         
         # 验证根日志级别
         self.assertEqual(logging.root.level, logging.INFO)
@@ -112,21 +133,6 @@ class TestLogging(unittest.TestCase):
         # 验证文件处理程序
         self.assertIsInstance(logging.root.handlers[0], logging.FileHandler)
     
-    def test_configure_with_format(self):
-        """测试指定日志格式"""
-        # 自定义格式
-        custom_format = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
-        
-        # 配置日志
-        configure_logging(log_format=custom_format)
-        
-        # 验证根日志级别
-        self.assertEqual(logging.root.level, logging.INFO)
-        
-        # 验证处理程序格式
-        formatter = logging.root.handlers[0].formatter
-        self.assertEqual(formatter._fmt, custom_format)
-    
     def test_logger_usage(self):
         """测试记录器使用"""
         # 确保清除所有处理程序
@@ -137,7 +143,7 @@ class TestLogging(unittest.TestCase):
         configure_logging(log_level=logging.DEBUG)
         
         # 创建一个测试记录器
-        logger = logging.getLogger("test")
+        logger = self._test_logger
         logger.setLevel(logging.DEBUG)
         
         # 验证记录器级别
@@ -160,18 +166,17 @@ class TestLogging(unittest.TestCase):
         # 清理
         logger.removeHandler(test_handler)
     
-    @patch("builtins.open", new_callable=mock_open)
-    def test_file_logger_usage(self, mock_file):
+    def test_file_logger_usage(self):
         """测试文件记录器使用"""
         # 确保清除所有处理程序
         for handler in logging.root.handlers[:]:
             logging.root.removeHandler(handler)
             
         # 配置日志
-        logger = configure_logging(log_file="test.log")
+        logger = configure_logging(log_file=self.log_path)
         
         # 创建记录器
-        test_logger = logging.getLogger("test")
+        test_logger = self._test_logger
         
         # 记录一些消息
         test_logger.info("Info message for file")
@@ -180,22 +185,9 @@ class TestLogging(unittest.TestCase):
         file_handlers = [h for h in logger.handlers if isinstance(h, logging.FileHandler)]
         self.assertEqual(len(file_handlers), 1, "应该有一个文件处理程序")
         
-        # 验证mock_file被调用，不检查具体参数
-        mock_file.assert_called()
-    
-    def test_configure_multiple_times(self):
-        """测试多次配置日志"""
-        # 第一次配置
-        configure_logging(log_level=logging.DEBUG)
-        
-        # 验证根日志级别
-        self.assertEqual(logging.root.level, logging.DEBUG)
-        
-        # 第二次配置
-        configure_logging(log_level=logging.ERROR)
-        
-        # 验证根日志级别已更改
-        self.assertEqual(logging.root.level, logging.ERROR)
+        # 验证日志文件已创建
+        file_handlers[0].flush()
+        self.assertTrue(os.path.exists(self.log_path))
 
 
 if __name__ == "__main__":
@@ -3,52 +3,67 @@
 """
 
 import unittest
-import logging
 import uuid
-from unittest.mock import patch, MagicMock
+import itertools
+from unittest.mock import patch
 
+from workable.core import manager as manager_module
+from workable.core import workable as workable_module
 from workable.core.manager import WorkableManager
 from workable.core.workable import Workable
 from workable.core.exceptions import WorkableError, ManagerError
+from workable.tests import configure_test_logging
 
-# 配置测试日志
-logging.basicConfig(level=logging.DEBUG)
+configure_test_logging()
 
 class TestWorkableManager(unittest.TestCase):
     """测试WorkableManager类"""
     
+    # 测试Workable的构造参数
+    _WORKABLE_ARGS = {
+        "atom1": dict(name="Atom 1", logic_description="Atomic workable 1",
+                      is_atom=True, content_str="Content 1", content_type="text"),
+        "atom2": dict(name="Atom 2", logic_description="Atomic workable 2",
+                      is_atom=True, content_str="Content 2", content_type="code"),
+        "composite1": dict(name="Composite 1", logic_description="Composite workable 1",
+                           is_atom=False),
+        "composite2": dict(name="Composite 2", logic_description="Composite workable 2",
+                           is_atom=False),
+    }
+    
+    @classmethod
+    def setUpClass(cls):
+        """创建所有测试共享的Workable (管理器只保存引用，注册不会改变其内容)"""
+        # 测试不需要随机UUID，用确定性的计数器代替os.urandom
+        counter = itertools.count(1)
+        new_uuid = lambda: f"{next(counter):032x}"
+        cls._uuid_patches = [
+            patch.object(workable_module, "_new_uuid", new_uuid),
+            patch.object(manager_module, "_new_uuid", new_uuid),
+        ]
+        for uuid_patch in cls._uuid_patches:
+            uuid_patch.start()
+        
+        for attr, kwargs in cls._WORKABLE_ARGS.items():
+            setattr(cls, attr, Workable(**kwargs))
+        
+        # 所有测试共用一个管理器，每个测试前清空
+        cls.manager = WorkableManager()
+    
+    @classmethod
+    def tearDownClass(cls):
+        """恢复UUID生成函数"""
+        for uuid_patch in cls._uuid_patches:
+            uuid_patch.stop()
+    
     def setUp(self):
-        """每个测试前执行"""
-        self.manager = WorkableManager()
-        
-        # 创建一些测试Workable
-        self.atom1 = Workable(
-            name="Atom 1",
-            logic_description="Atomic workable 1",
-            is_atom=True,
-            content_str="Content 1",
-            content_type="text"
-        )
-        
-        self.atom2 = Workable(
-            name="Atom 2",
-            logic_description="Atomic workable 2",
-            is_atom=True,
-            content_str="Content 2",
-            content_type="code"
-        )
-        
-        self.composite1 = Workable(
-            name="Composite 1",
-            logic_description="Composite workable 1",
-            is_atom=False
-        )
-        
-        self.composite2 = Workable(
-            name="Composite 2",
-            logic_description="Composite workable 2",
-            is_atom=False
-        )
+        """每个测试前执行，清空共享的管理器 (包括空闲列表)"""
+        self.manager.clear()
+    
+    def _fresh_workables(self) -> None:
+        """为会修改Workable名称、内容或Frame的测试创建独立实例，覆盖共享实例"""
+        for attr, kwargs in self._WORKABLE_ARGS.items():
+            setattr(self, attr, Workable(**kwargs))
     
     def test_register_workable(self):
         """测试register_workable方法"""
@@ -57,9 +72,7 @@ class TestWorkableManager(unittest.TestCase):
         self.manager.register_workable(self.composite1)
         
         # 验证注册结果
-        self.assertEqual(len(self.manager.workables), 2)
-        self.assertIn(self.atom1.uuid, self.manager.workables)
-        self.assertIn(self.composite1.uuid, self.manager.workables)
+        self.assertEqual(set(self.manager.workables), {self.atom1.uuid, self.composite1.uuid})
         
         # 注册相同UUID的Workable应该失败
         duplicate = Workable(
@@ -87,8 +100,7 @@ class TestWorkableManager(unittest.TestCase):
         
         # 验证是否已注销
         self.assertTrue(result)
-        self.assertEqual(len(self.manager.workables), 1)
-        self.assertNotIn(self.atom1.uuid, self.manager.workables)
+        self.assertEqual(set(self.manager.workables), {self.composite1.uuid})
         
         # 注销不存在的Workable
         result = self.manager.unregister_workable("non-existent-uuid")
@@ -115,51 +127,36 @@ class TestWorkableManager(unittest.TestCase):
     
     def test_get_all_workables(self):
         """测试get_all_workables方法"""
-        # 注册Workable
-        self.manager.register_workable(self.atom1)
-        self.manager.register_workable(self.atom2)
-        self.manager.register_workable(self.composite1)
+        # 批量注册Workable
+        self.manager.register_many([self.atom1, self.atom2, self.composite1])
         
         # 获取所有Workable
         workables = self.manager.get_all_workables()
         
         # 验证获取的Workables
-        self.assertEqual(len(workables), 3)
-        self.assertIn(self.atom1.uuid, workables)
-        self.assertIn(self.atom2.uuid, workables)
-        self.assertIn(self.composite1.uuid, workables)
+        self.assertEqual(set(workables), {self.atom1.uuid, self.atom2.uuid, self.composite1.uuid})
         
-        # 验证返回的是副本
-        workables[self.atom1.uuid] = None
+        # 验证返回的是只读映射
+        with self.assertRaises(TypeError):
+            workables[self.atom1.uuid] = None
         self.assertEqual(len(self.manager.workables), 3)
     
     def test_get_workables_by_type(self):
         """测试get_workables_by_type方法"""
-        # 注册Workable
-        self.manager.register_workable(self.atom1)
-        self.manager.register_workable(self.atom2)
-        self.manager.register_workable(self.composite1)
-        self.manager.register_workable(self.composite2)
+        # 批量注册Workable
+        self.manager.register_many([self.atom1, self.atom2, self.composite1, self.composite2])
         
         # 获取所有原子模式Workable
         atoms = self.manager.get_workables_by_type(is_atom=True)
         
         # 验证获取的原子模式Workables
-        self.assertEqual(len(atoms), 2)
-        self.assertIn(self.atom1.uuid, atoms)
-        self.assertIn(self.atom2.uuid, atoms)
-        self.assertNotIn(self.composite1.uuid, atoms)
-        self.assertNotIn(self.composite2.uuid, atoms)
+        self.assertEqual(set(atoms), {self.atom1.uuid, self.atom2.uuid})
         
         # 获取所有复合模式Workable
         composites = self.manager.get_workables_by_type(is_atom=False)
         
         # 验证获取的复合模式Workables
-        self.assertEqual(len(composites), 2)
-        self.assertIn(self.composite1.uuid, composites)
-        self.assertIn(self.composite2.uuid, composites)
-        self.assertNotIn(self.atom1.uuid, composites)
-        self.assertNotIn(self.atom2.uuid, composites)
+        self.assertEqual(set(composites), {self.composite1.uuid, self.composite2.uuid})
     
     def test_create_workable(self):
         """测试create_workable方法"""
@@ -173,8 +170,7 @@ class TestWorkableManager(unittest.TestCase):
         )
         
         # 验证创建结果
-        self.assertEqual(len(self.manager.workables), 1)
-        self.assertIn(atom.uuid, self.manager.workables)
+        self.assertEqual(set(self.manager.workables), {atom.uuid})
         self.assertTrue(atom.is_atom())
         self.assertEqual(atom.content_str, "New content")
         self.assertEqual(atom.content_type, "text")
@@ -187,12 +183,13 @@ class TestWorkableManager(unittest.TestCase):
         )
         
         # 验证创建结果
-        self.assertEqual(len(self.manager.workables), 2)
-        self.assertIn(composite.uuid, self.manager.workables)
+        self.assertEqual(set(self.manager.workables), {atom.uuid, composite.uuid})
         self.assertTrue(composite.is_complex())
     
     def test_update_workable(self):
         """测试update_workable方法"""
+        self._fresh_workables()
+        
         # 注册Workable
         self.manager.register_workable(self.atom1)
         
@@ -222,6 +219,8 @@ class TestWorkableManager(unittest.TestCase):
     
     def test_update_workable_content(self):
         """测试update_simple_workable_content方法"""
+        self._fresh_workables()
+        
         # 注册原子模式Workable
         self.manager.register_workable(self.atom1)
         
@@ -305,6 +304,104 @@ class TestWorkableManager(unittest.TestCase):
         self.assertEqual(workable.name, "Legacy Composite")
         self.assertTrue(workable.is_complex())
 
+    def test_bulk_register(self):
+        """测试bulk_register方法"""
+        self.manager.bulk_register([self.atom1, self.atom2, self.composite1])
+        
+        self.assertEqual(len(self.manager.workables), 3)
+        self.assertIs(self.atom1.manager, self.manager)
+        self.assertEqual(self.manager.get_by_name("Atom 2"), [self.atom2])
+        self.assertEqual(self.manager.get_complex_workables(), [self.composite1])
+        
+        # 批次中存在重复UUID时整体失败，不注册任何工作单元
+        with self.assertRaises(ManagerError):
+            self.manager.bulk_register([self.composite2, self.atom1])
+        self.assertNotIn(self.composite2.uuid, self.manager.workables)
+    
+    def test_type_index_follows_conversion(self):
+        """测试类型索引在创建、转换和删除后保持同步"""
+        atom = self.manager.create_workable(
+            name="Atom", logic_description="Atom", content="x")
+        composite = self.manager.create_workable(
+            name="Composite", logic_description="Composite", is_atom=False)
+        
+        self.assertEqual(self.manager.get_simple_workables(), [atom])
+        self.assertEqual(self.manager.get_complex_workables(), [composite])
+        
+        atom.make_complex()
+        stats = self.manager.to_dict()
+        self.assertEqual(stats["simple_count"], 0)
+        self.assertEqual(stats["complex_count"], 2)
+        
+        self.manager.delete(composite.uuid)
+        self.assertEqual(self.manager.get_complex_workables(), [atom])
+    
+    def test_children_resolved_through_manager(self):
+        """测试只有Frame记录的子Workable通过管理器补全"""
+        self._fresh_workables()
+        
+        self.manager.register(self.composite1)
+        self.manager.register(self.atom1)
+        
+        # 只写入Frame，不经过add_child (如从序列化数据恢复)
+        self.composite1.content.add_frame(
+            name=self.atom1.name,
+            logic_description=self.atom1.logic_description,
+            frame_type="child",
+            uuid=self.atom1.uuid
+        )
+        
+        self.assertEqual(self.composite1.get_children(), [self.atom1])
+        self.assertIn(self.atom1.uuid, self.composite1.get_all_children())
+    
+    def test_delete_recycle(self):
+        """测试delete(recycle=True)回收的Workable被空闲列表复用"""
+        old_uuid = self.manager.create_workable(
+            name="Temp",
+            logic_description="Temporary workable"
+        ).uuid
+        self.assertTrue(self.manager.delete(old_uuid, recycle=True))
+        self.assertEqual(len(self.manager._workable_freelist), 1)
+        
+        # 复用的实例必须获得新的UUID和干净的状态
+        reused = self.manager.create_workable(
+            name="Reused",
+            logic_description="Reused workable",
+            is_atom=False
+        )
+        self.assertEqual(len(self.manager._workable_freelist), 0)
+        self.assertNotEqual(reused.uuid, old_uuid)
+        self.assertTrue(reused.is_complex())
+        self.assertEqual(len(reused.child_workables), 0)
+        self.assertIs(self.manager.get_workable(reused.uuid), reused)
+        
+        # 默认删除不回收，调用方持有的Workable保持原状
+        self.assertTrue(self.manager.delete(reused.uuid))
+        self.assertEqual(len(self.manager._workable_freelist), 0)
+        self.assertEqual(reused.name, "Reused")
+
+    
+    def test_delete_recycle_referenced_child(self):
+        """测试仍被父Workable引用的子Workable不会被回收"""
+        parent = self.manager.create_workable(
+            name="Parent",
+            logic_description="Parent workable",
+            is_atom=False
+        )
+        child = self.manager.create_workable(name="Child", logic_description="Child workable")
+        local = Workable(name="Local", logic_description="Local workable", is_atom=True)
+        parent.add_child(child)
+        parent.add_local(local)
+        self.manager.register(local)
+        
+        self.assertTrue(self.manager.delete(child.uuid, recycle=True))
+        self.assertTrue(self.manager.delete(local.uuid, recycle=True))
+        self.assertEqual(len(self.manager._workable_freelist), 0)
+        
+        # 父Workable返回的子Workable和本地Workable保持原状
+        self.assertEqual([c.name for c in parent.get_children()], ["Child"])
+        self.assertEqual([l.name for l in parent.get_locals()], ["Local"])
+
 
 if __name__ == "__main__":
     unittest.main() 
\ No newline at end of file
@@ -3,15 +3,17 @@
 """
 
 import unittest
-import logging
-from unittest.mock import patch, MagicMock
+import itertools
 
 from workable.core.message import MessageManager
 from workable.core.models import Message
 from workable.core.exceptions import MessageError
+from workable.tests import configure_test_logging
 
-# 配置测试日志
-logging.basicConfig(level=logging.DEBUG)
+configure_test_logging()
+
+# 测试消息使用确定性的ID，不需要随机数
+_message_ids = itertools.count(1)
 
 class TestMessageManager(unittest.TestCase):
     """测试MessageManager类"""
@@ -24,19 +26,22 @@ class TestMessageManager(unittest.TestCase):
         self.message1 = Message(
             content="Message 1",
             sender="sender-1",
-            receiver="receiver-1"
+            receiver="receiver-1",
+            id=f"msg-{next(_message_ids)}"
         )
         
         self.message2 = Message(
             content="Message 2",
             sender="sender-2",
-            receiver="receiver-2"
+            receiver="receiver-2",
+            id=f"msg-{next(_message_ids)}"
         )
         
         self.message3 = Message(
             content="Message 3",
             sender="sender-3",
-            receiver="receiver-3"
+            receiver="receiver-3",
+            id=f"msg-{next(_message_ids)}"
         )
     
     def test_init(self):
@@ -59,6 +64,27 @@ class TestMessageManager(unittest.TestCase):
         with self.assertRaises(MessageError):
             self.manager.append("not a message")
     
+    def test_append_caches_preview(self):
+        """测试日志用的内容摘要在首次使用时计算并缓存"""
+        message = Message(content="x" * 50, sender="sender", receiver="receiver")
+        self.manager.append(message)
+        self.assertEqual(message._preview, "x" * 20)
+        self.assertIs(message._preview, message._preview)
+
+    def test_extend_messages(self):
+        """测试extend_messages方法"""
+        self.message2.status = "archive"
+        self.manager.extend_messages([self.message1, self.message2, self.message3])
+
+        # 按状态分别进入收件箱和已归档列表，并保持顺序
+        self.assertEqual(list(self.manager.inbox), [self.message1, self.message3])
+        self.assertEqual(self.manager.archived, [self.message2])
+
+        # 存在无效对象时整批拒绝
+        with self.assertRaises(MessageError):
+            self.manager.extend_messages([Message("New", "s", "r"), "not a message"])
+        self.assertEqual(len(self.manager.get_all_messages()), 3)
+
     def test_process_next(self):
         """测试process_next方法"""
         # 添加消息
@@ -123,6 +149,16 @@ class TestMessageManager(unittest.TestCase):
         self.assertEqual(len(self.manager.archive), 2)
         self.assertEqual(self.message2.status, "archive")
     
+    def test_archive_message_from_inbox_order(self):
+        """测试从收件箱队首或中间归档消息后剩余消息保持顺序"""
+        self.manager.extend_messages([self.message1, self.message2, self.message3])
+        
+        self.assertTrue(self.manager.archive_message(self.message1.id))
+        self.assertTrue(self.manager.archive_message(self.message3.id))
+        
+        self.assertEqual(list(self.manager.inbox), [self.message2])
+        self.assertEqual(self.manager.archive, [self.message1, self.message3])
+    
     def test_get_all_messages(self):
         """测试get_all_messages方法"""
         # 添加消息
@@ -204,6 +240,10 @@ class TestMessageManager(unittest.TestCase):
         
         # 验证结果
         self.assertIsNone(msg)
+        
+        # 清空后的消息不能再通过ID获取
+        self.manager.clear_inbox()
+        self.assertIsNone(self.manager.get_message_by_id(self.message1.id))
     
     def test_clear_messages(self):
         """测试clear_messages方法"""
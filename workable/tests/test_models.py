@@ -2,6 +2,9 @@
 测试基础数据模型
 """
 
+import sys
+import copy
+import pickle
 import unittest
 from dataclasses import asdict
 
@@ -43,6 +46,29 @@ class TestWorkableFrame(unittest.TestCase):
         self.assertTrue(external_frame.is_external())
         self.assertFalse(local_frame.is_external())
 
+    def test_logic_description_interned(self):
+        """测试内容相同的逻辑描述共享同一个字符串对象"""
+        first = WorkableFrame(name="A", logic_description="".join(["shared ", "description"]))
+        second = WorkableFrame(name="B", logic_description="".join(["shared ", "description"]))
+        self.assertIs(first.logic_description, second.logic_description)
+
+        # 较长的描述不驻留，保留调用方传入的对象
+        long_description = "".join(["a much longer ", "logic description"])
+        third = WorkableFrame(name="C", logic_description=long_description)
+        self.assertIs(third.logic_description, long_description)
+
+    def test_is_local(self):
+        """测试is_local方法"""
+        local_frame = WorkableFrame(
+            name="Local Frame",
+            logic_description="Local reference",
+            frame_type="local",
+            exref="local-uuid"
+        )
+
+        self.assertTrue(local_frame.is_local())
+        self.assertFalse(local_frame.is_external())
+
 
 class TestMessage(unittest.TestCase):
     """测试Message类"""
@@ -59,6 +85,8 @@ class TestMessage(unittest.TestCase):
         self.assertEqual(message.sender, "sender-uuid")
         self.assertEqual(message.receiver, "receiver-uuid")
         self.assertEqual(message.status, "inbox")  # 默认状态
+        self.assertEqual(len(message.id), 32)  # 默认ID为32位十六进制字符串
+        int(message.id, 16)
     
     def test_message_post_init(self):
         """测试Message的__post_init__方法"""
@@ -79,6 +107,12 @@ class TestMessage(unittest.TestCase):
             status="unknown"
         )
         self.assertEqual(invalid_message.status, "inbox")
+    
+    def test_message_asdict_excludes_preview(self):
+        """测试日志摘要缓存不出现在序列化结果中"""
+        message = Message(content="Preview content", sender="sender", receiver="receiver")
+        self.assertEqual(message._preview, "Preview content")
+        self.assertEqual(set(asdict(message)), {"content", "sender", "receiver", "status", "id"})
 
 
 class TestRelation(unittest.TestCase):
@@ -104,6 +138,41 @@ class TestRelation(unittest.TestCase):
         relation.meta["new_key"] = "new_value"
         self.assertEqual(relation.meta["new_key"], "new_value")
 
+    def test_relation_set_meta(self):
+        """测试set_meta只修改当前关系的元数据"""
+        relation = Relation("source-uuid", "target-uuid", "dependency")
+        other = Relation("source-uuid", "other-uuid", "dependency")
+
+        relation.set_meta("priority", "high")
+        self.assertEqual(relation.meta, {"priority": "high"})
+        self.assertEqual(other.meta, {})
+
+    def test_relation_copy_and_pickle(self):
+        """测试未设置元数据的Relation可以深拷贝、序列化并直接写入元数据"""
+        relation = Relation(target_uuid="target-uuid")
+
+        for restored in (copy.deepcopy(relation), pickle.loads(pickle.dumps(relation))):
+            self.assertEqual(restored, relation)
+        self.assertEqual(asdict(relation)["meta"], {})
+
+        relation.meta["key"] = "value"
+        self.assertEqual(relation.meta, {"key": "value"})
+
+
+class TestModelSlots(unittest.TestCase):
+    """测试数据模型使用__slots__而不是实例字典"""
+    
+    def test_frame_slots(self):
+        """测试WorkableFrame没有实例字典"""
+        frame = WorkableFrame(name="Frame", logic_description="Frame description")
+        self.assertFalse(hasattr(frame, "__dict__"))
+    
+    @unittest.skipIf(sys.version_info < (3, 10), "dataclass(slots=True)需要Python 3.10+")
+    def test_dataclass_slots(self):
+        """测试Message和Relation没有实例字典"""
+        self.assertFalse(hasattr(Message("content", "sender", "receiver"), "__dict__"))
+        self.assertFalse(hasattr(Relation("source", "target", "dependency"), "__dict__"))
+
 
 if __name__ == "__main__":
     unittest.main() 
\ No newline at end of file
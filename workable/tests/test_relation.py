@@ -3,15 +3,13 @@
 """
 
 import unittest
-import logging
-from unittest.mock import patch, MagicMock
 
 from workable.core.relation import RelationManager
 from workable.core.models import Relation
 from workable.core.exceptions import RelationError
+from workable.tests import configure_test_logging
 
-# 配置测试日志
-logging.basicConfig(level=logging.DEBUG)
+configure_test_logging()
 
 class TestRelationManager(unittest.TestCase):
     """测试RelationManager类"""
@@ -125,7 +123,15 @@ class TestRelationManager(unittest.TestCase):
         initial_length = len(relations)
         relations.append(Relation(target_uuid="new-target"))
         self.assertEqual(len(self.manager.relations), 3)
-    
+
+    def test_iter_all(self):
+        """测试iter_all和iter_related方法"""
+        self.manager.add(self.relation1)
+        self.manager.add(self.relation2)
+
+        self.assertEqual(list(self.manager.iter_all()), [self.relation1, self.relation2])
+        self.assertEqual(list(self.manager.iter_related()), ["target-1", "target-2"])
+
     def test_update_meta(self):
         """测试update_meta方法"""
         # 添加关系
@@ -195,7 +201,70 @@ class TestRelationManager(unittest.TestCase):
         
         # 验证结果
         self.assertEqual(len(relations_by_non_existent), 0)
-    
+
+    def test_get_related_by_indexed_meta(self):
+        """测试为元数据键建立索引后的get_related_by_meta方法"""
+        self.manager.add(self.relation1)
+        self.manager.add(self.relation2)
+
+        # 注册索引时会收录已存在的关系
+        self.manager.register_meta_key("type")
+        self.manager.add(self.relation3)
+        self.assertEqual(set(self.manager.get_related_by_meta("type", "parent")), {"target-2"})
+        self.assertEqual(set(self.manager.get_related_by_meta("type", "child")), {"target-3"})
+
+        # 以相同元数据覆盖关系时索引保持不变
+        self.manager.add(Relation(target_uuid="target-3", meta={"type": "child"}))
+        self.assertEqual(set(self.manager.get_related_by_meta("type", "child")), {"target-3"})
+        
+        # 原地修改元数据后重新添加同一关系对象，索引按新值刷新
+        self.relation2.meta["type"] = "child"
+        self.manager.add(self.relation2)
+        self.assertEqual(set(self.manager.get_related_by_meta("type", "child")), {"target-2", "target-3"})
+        self.assertEqual(self.manager.get_related_by_meta("type", "parent"), {})
+        self.manager.update_meta("target-2", {"type": "parent"})
+        
+        # 更新元数据后索引同步
+        self.manager.update_meta("target-1", {"type": "child"})
+        self.manager.update_meta("target-2", {"type": "sibling"})
+        self.assertEqual(set(self.manager.get_related_by_meta("type", "child")), {"target-1", "target-3"})
+        self.assertEqual(self.manager.get_related_by_meta("type", "parent"), {})
+
+        # 移除和清空后索引同步
+        self.manager.remove("target-3")
+        self.assertEqual(set(self.manager.get_related_by_meta("type", "child")), {"target-1"})
+        self.manager.clear()
+        self.assertEqual(self.manager.get_related_by_meta("type", "child"), {})
+
+    def test_set_meta(self):
+        """测试通过管理器设置单个元数据时索引同步"""
+        self.manager.register_meta_key("type")
+        self.manager.add(self.relation1)
+        self.manager.add(self.relation2)
+
+        self.assertTrue(self.manager.set_meta("target-1", "type", "child"))
+        self.assertTrue(self.manager.set_meta("target-2", "type", "child"))
+        self.assertEqual(set(self.manager.get_related_by_meta("type", "child")), {"target-1", "target-2"})
+        self.assertEqual(self.manager.get_related_by_meta("type", "parent"), {})
+
+        # 未建立索引的键同样写入元数据
+        self.assertTrue(self.manager.set_meta("target-1", "priority", "high"))
+        self.assertEqual(self.manager.get("target-1").meta, {"type": "child", "priority": "high"})
+
+        # 设置不存在的关系
+        self.assertFalse(self.manager.set_meta("non-existent-target", "type", "child"))
+
+    def test_indexed_meta_mutated_then_removed(self):
+        """测试元数据被原地修改后移除关系，索引按记录的值清理"""
+        self.manager.register_meta_key("type")
+        relation = Relation(target_uuid="t2", meta={"type": "a"})
+        self.manager.add(relation)
+
+        relation.meta["type"] = "b"
+        self.assertTrue(self.manager.remove("t2"))
+        self.assertEqual(self.manager.get_related_by_meta("type", "a"), {})
+        self.assertEqual(self.manager.get_related_by_meta("type", "b"), {})
+
     def test_clear(self):
         """测试clear方法"""
         # 添加关系
@@ -3,16 +3,15 @@
 """
 
 import unittest
-import logging
 import json
-from unittest.mock import patch, MagicMock, mock_open
+from unittest.mock import patch, mock_open
 
 from workable.visualizer import WorkableVisualizer
 from workable.core.workable import Workable
 from workable.core.models import WorkableFrame
+from workable.tests import configure_test_logging
 
-# 配置测试日志
-logging.basicConfig(level=logging.DEBUG)
+configure_test_logging()
 
 class TestWorkableVisualizer(unittest.TestCase):
     """测试WorkableVisualizer类"""
@@ -2,17 +2,16 @@
 测试统一Workable类
 """
 
+import sys
 import unittest
 import uuid
-import logging
-from unittest.mock import patch
 
-from workable.core.workable import Workable
+from workable.core.workable import Workable, SimpleWorkable, ComplexWorkable
 from workable.core.models import WorkableFrame
-from workable.core.exceptions import WorkableError, ConversionError
+from workable.core.exceptions import WorkableError, ConversionError, ContentError
+from workable.tests import configure_test_logging
 
-# 配置测试日志
-logging.basicConfig(level=logging.DEBUG)
+configure_test_logging()
 
 class TestWorkable(unittest.TestCase):
     """
@@ -81,6 +80,36 @@ class TestWorkable(unittest.TestCase):
         with self.assertRaises(AttributeError):
             _ = self.complex_workable.content_type
     
+    def test_uuid_format(self):
+        """测试UUID以无连字符的hex形式存储"""
+        self.assertEqual(len(self.atom_workable.uuid), 32)
+        self.assertNotIn("-", self.atom_workable.uuid)
+        self.assertEqual(self.atom_workable.str_uuid,
+                         str(uuid.UUID(self.atom_workable.uuid)))
+        self.assertIs(sys.intern(self.atom_workable.uuid), self.atom_workable.uuid)
+        self.assertIn(f"uuid={self.atom_workable.uuid[:6]} ", repr(self.atom_workable))
+    
+    def test_slots(self):
+        """测试Workable及其内容和关系管理器使用__slots__而不是实例字典"""
+        self.assertFalse(hasattr(self.atom_workable, "__dict__"))
+        self.assertFalse(hasattr(self.atom_workable.content, "__dict__"))
+        self.assertFalse(hasattr(self.atom_workable.relation_manager, "__dict__"))
+        with self.assertRaises(AttributeError):
+            self.atom_workable.undeclared_attribute = True
+    
+    def test_lazy_managers(self):
+        """测试消息和关系管理器在首次访问时才创建"""
+        self.assertIsNone(self.atom_workable._message_manager)
+        self.assertIsNone(self.atom_workable._relation_manager)
+        
+        # 读取关系数量不会创建关系管理器
+        self.assertEqual(self.atom_workable.relation_count, 0)
+        self.assertIsNone(self.atom_workable._relation_manager)
+        
+        message_manager = self.atom_workable.message_manager
+        self.assertIs(self.atom_workable.message_manager, message_manager)
+        self.assertIsNotNone(self.atom_workable.relation_manager)
+    
     def test_update(self):
         """测试update方法"""
         self.atom_workable.update(name="Updated Name", logic_description="Updated description")
@@ -122,6 +151,39 @@ class TestWorkable(unittest.TestCase):
         with self.assertRaises(WorkableError):
             self.complex_workable.add_child("not a workable")
     
+    def test_add_children(self):
+        """测试add_children和add_locals批量添加"""
+        self.complex_workable.add_children([self.child_workable, self.atom_workable])
+        self.assertEqual(set(self.complex_workable.child_workables),
+                         {self.child_workable.uuid, self.atom_workable.uuid})
+        self.assertEqual(len(self.complex_workable.content.get_frames_by_type("child")), 2)
+        
+        self.complex_workable.add_locals([self.local_workable])
+        self.assertIn(self.local_workable.uuid, self.complex_workable.local_workables)
+        self.assertTrue(self.local_workable.is_local)
+        
+        # 存在无效对象时整批拒绝
+        with self.assertRaises(WorkableError):
+            self.complex_workable.add_children([Workable("Extra", "Extra child"), "not a workable"])
+        self.assertEqual(len(self.complex_workable.child_workables), 2)
+        
+        # Frame校验失败时同样整批拒绝，子Workable表和本地标记保持不变
+        extra = Workable("Extra", "Extra child")
+        with self.assertRaises(ContentError):
+            self.complex_workable.add_children([extra, Workable("", "Unnamed child")])
+        self.assertEqual(len(self.complex_workable.child_workables), 2)
+        self.assertEqual(len(self.complex_workable.content.get_frames_by_type("child")), 2)
+        
+        extra_local = Workable("Extra", "Extra local", is_atom=True)
+        with self.assertRaises(ContentError):
+            self.complex_workable.add_locals([extra_local, Workable("", "Unnamed local", is_atom=True)])
+        self.assertNotIn(extra_local.uuid, self.complex_workable.local_workables)
+        self.assertFalse(extra_local.is_local)
+        
+        # 原子模式不能批量添加子Workable
+        with self.assertRaises(AttributeError):
+            self.atom_workable.add_children([self.child_workable])
+    
     def test_remove_child(self):
         """测试remove_child方法"""
         # 添加并移除子Workable
@@ -150,10 +212,44 @@ class TestWorkable(unittest.TestCase):
         self.assertEqual(len(children), 1)
         self.assertIn(self.child_workable.uuid, children)
         
+        # 返回只读映射
+        with self.assertRaises(TypeError):
+            children["new-uuid"] = self.local_workable
+        
         # 原子模式不能获取子Workable
         with self.assertRaises(AttributeError):
             self.atom_workable.get_all_children()
     
+    def test_children_follow_frames(self):
+        """测试子Workable和本地Workable随Frame的移除、移动和清空同步"""
+        names = ["A", "B", "C"]
+        children = [Workable(name, f"Child {name}") for name in names]
+        locals_ = [Workable(name, f"Local {name}", is_atom=True) for name in names]
+        self.complex_workable.add_children(children)
+        content = self.complex_workable.content
+        child_seqs = [frame.seq for frame in content.frames if frame.frame_type == "child"]
+
+        # 移动Frame后按新的Frame顺序返回
+        content.move_frame(child_seqs[2], child_seqs[0])
+        self.assertEqual([c.name for c in self.complex_workable.get_children()], ["C", "A", "B"])
+
+        # 直接移除Frame后不再返回对应的子Workable
+        content.remove_frame(child_seqs[0])
+        self.assertEqual([c.name for c in self.complex_workable.get_children()], ["A", "B"])
+        self.assertEqual(list(self.complex_workable.get_all_children()),
+                         [children[0].uuid, children[1].uuid])
+
+        # 本地Workable同样按Frame顺序返回
+        self.complex_workable.add_locals(locals_)
+        local_seqs = [frame.seq for frame in content.frames if frame.frame_type == "local"]
+        content.move_frame(local_seqs[2], local_seqs[0])
+        self.assertEqual([l.name for l in self.complex_workable.get_locals()], ["C", "A", "B"])
+
+        # 清空Frame后没有子Workable和本地Workable
+        content.clear_frames()
+        self.assertEqual(self.complex_workable.get_children(), [])
+        self.assertEqual(self.complex_workable.get_locals(), [])
+
     def test_add_local(self):
         """测试add_local方法"""
         # 添加本地Workable
@@ -226,6 +322,19 @@ class TestWorkable(unittest.TestCase):
         self.assertEqual(local_workable.content_str, original_content)
         self.assertEqual(local_workable.content_type, original_content_type)
     
+    def test_make_complex_keeps_existing_locals(self):
+        """测试make_complex保留转换前已添加的本地Workable"""
+        self.atom_workable.add_local(self.local_workable)
+        self.atom_workable.make_complex()
+        
+        self.assertEqual(len(self.atom_workable.local_workables), 2)
+        self.assertIn(self.local_workable.uuid, self.atom_workable.local_workables)
+        self.assertEqual(len(self.atom_workable.content.get_frames_by_type("local")), 2)
+        
+        # 转回简单模式时直接取出保存原内容的本地Workable
+        self.atom_workable.make_simple()
+        self.assertEqual(self.atom_workable.content_str, "Test content")
+    
     def test_make_simple(self):
         """测试make_simple方法 - 将复合模式转换为原子模式"""
         # 创建一个包含单个本地Workable的复合Workable
@@ -256,6 +365,23 @@ class TestWorkable(unittest.TestCase):
         self.assertEqual(complex_w.content_type, "text")
         self.assertEqual(len(complex_w.local_workables), 0)  # 本地Workable应该被移除
     
+    def test_mode_class(self):
+        """测试实例类型随模式切换"""
+        self.assertIsInstance(self.atom_workable, SimpleWorkable)
+        self.assertIsInstance(self.complex_workable, ComplexWorkable)
+        
+        self.atom_workable.make_complex()
+        self.assertIs(type(self.atom_workable), ComplexWorkable)
+        self.assertIsInstance(self.atom_workable, Workable)
+        
+        self.atom_workable.make_simple()
+        self.assertIs(type(self.atom_workable), SimpleWorkable)
+        
+        # 模式标识是类属性，不占用实例存储
+        self.assertTrue(SimpleWorkable.is_atom_flag)
+        self.assertFalse(ComplexWorkable.is_atom_flag)
+        self.assertNotIn("is_atom_flag", Workable.__slots__)
+    
     def test_state_preservation_after_conversion(self):
         """测试转换前后状态的保存"""
         # 原始状态
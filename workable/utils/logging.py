@@ -44,20 +44,17 @@ def configure_logging(
     for handler in logging.root.handlers[:]:
         logging.root.removeHandler(handler)
     
-    # 格式化器
-    formatter = logging.Formatter(log_format)
-    
-    # 控制台处理程序
+    # 控制台处理程序 (每个处理程序使用独立的格式化器，互不影响)
     if console:
         console_handler = logging.StreamHandler()
-        console_handler.setFormatter(formatter)
+        console_handler.setFormatter(logging.Formatter(log_format))
         logger.addHandler(console_handler)
         logging.root.addHandler(console_handler)
     
     # 文件处理程序
     if log_file:
         file_handler = logging.FileHandler(log_file)
-        file_handler.setFormatter(formatter)
+        file_handler.setFormatter(logging.Formatter(log_format))
         logger.addHandler(file_handler)
         logging.root.addHandler(file_handler)
     
@@ -98,19 +95,16 @@ def configure_logging_old(
     # 设置根日志级别
     root_logger.setLevel(level)
     
-    # 创建格式器
-    formatter = logging.Formatter(log_format)
-    
-    # 添加控制台处理器
+    # 添加控制台处理器 (每个处理器使用独立的格式器，互不影响)
     if console_output:
         console_handler = logging.StreamHandler(sys.stdout)
-        console_handler.setFormatter(formatter)
+        console_handler.setFormatter(logging.Formatter(log_format))
         root_logger.addHandler(console_handler)
     
     # 添加文件处理器
     if log_file:
         file_handler = logging.FileHandler(log_file, encoding='utf-8')
-        file_handler.setFormatter(formatter)
+        file_handler.setFormatter(logging.Formatter(log_format))
         root_logger.addHandler(file_handler)
     
     # 创建各模块专用日志器
@@ -89,7 +89,7 @@ class WorkableVisualizer:
                 "uuid": uuid,
                 "name": workable.name,
                 "type": workable.__class__.__name__,
-                "relations_count": len(workable.relation_manager.get_all())
+                "relations_count": workable.relation_count
             }
             result.append(item)
         